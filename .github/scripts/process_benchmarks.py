@@ -3,82 +3,95 @@
 import json
 import glob
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from statistics import mean, stdev
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def load_criterion_data(file_path: str) -> Dict[str, Any]:
     """Load and parse a Criterion benchmark result file."""
-    with open(file_path) as f:
-        return json.load(f)
+    # Read raw bytes to skip text decoding; both parsers accept UTF-8 bytes
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def load_result_file(file_path: str) -> tuple:
+    """Load a result file together with its modification time, statting it once."""
+    return os.stat(file_path).st_mtime, load_criterion_data(file_path)
 
 def extract_metric(data: Dict[str, Any], metric: str = "mean") -> float:
     """Extract a specific metric from Criterion benchmark data."""
     return float(data["estimates"][metric]["point_estimate"])
 
-def process_format_benchmarks(result_files: List[str]) -> Dict[str, Dict[str, List[float]]]:
-    """Process benchmarks for different image formats."""
-    format_data = {
-        "jpeg": {"dates": [], "values": []},
-        "webp": {"dates": [], "values": []},
-        "avif": {"dates": [], "values": []}
-    }
-    
-    for file in result_files:
-        if "process_" not in file:
-            continue
-            
-        data = load_criterion_data(file)
-        date = datetime.fromtimestamp(os.path.getmtime(file)).isoformat()
-        
-        if "jpeg" in file:
-            format_data["jpeg"]["dates"].append(date)
-            format_data["jpeg"]["values"].append(extract_metric(data))
-        elif "webp" in file:
-            format_data["webp"]["dates"].append(date)
-            format_data["webp"]["values"].append(extract_metric(data))
-        elif "avif" in file:
-            format_data["avif"]["dates"].append(date)
-            format_data["avif"]["values"].append(extract_metric(data))
-    
-    return format_data
+FORMATS = ["jpeg", "webp", "avif"]
+QUALITIES = [60, 75, 85, 95]
+SIZE_LABELS = ["single_size", "two_sizes", "four_sizes"]
+
+# Result files are small and I/O bound, so a handful of threads overlap the reads well
+LOAD_WORKERS = 8
+
+def process_benchmarks(result_files: List[str]) -> Dict[str, Any]:
+    """Process format, size and quality benchmarks in a single pass over the result files.
+
+    Each file is classified once, then every file that contributes to any of
+    the three groups is loaded exactly once on a thread pool.
+    """
+    format_files: List[tuple] = []
+    size_files: List[str] = []
+    quality_files: Dict[tuple, str] = {}
 
-def process_size_benchmarks(result_files: List[str]) -> Dict[str, List[float]]:
-    """Process benchmarks for different image sizes."""
-    size_data = {
-        "labels": ["single_size", "two_sizes", "four_sizes"],
-        "values": []
-    }
-    
     for file in result_files:
-        if "size_variants" not in file:
-            continue
-            
-        data = load_criterion_data(file)
-        size_data["values"].append(extract_metric(data))
-    
-    return size_data
+        if "process_" in file:
+            format_name = next((name for name in FORMATS if name in file), None)
+            if format_name:
+                format_files.append((file, format_name))
+
+        if "size_variants" in file:
+            size_files.append(file)
+
+        for format_name in FORMATS:
+            if format_name not in file:
+                continue
+            for quality in QUALITIES:
+                # Only the first matching file counts for each format/quality pair
+                if f"quality_{quality}" in file:
+                    quality_files.setdefault((format_name, quality), file)
+
+    needed = list(dict.fromkeys([file for file, _ in format_files] + size_files + list(quality_files.values())))
+    mtimes: Dict[str, float] = {}
+    parsed: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        for file, (mtime, data) in zip(needed, executor.map(load_result_file, needed), strict=True):
+            mtimes[file] = mtime
+            parsed[file] = data
+
+    format_data = {name: {"dates": [], "values": []} for name in FORMATS}
+    for file, format_name in format_files:
+        format_data[format_name]["dates"].append(datetime.fromtimestamp(mtimes[file]).isoformat())
+        format_data[format_name]["values"].append(extract_metric(parsed[file]))
+
+    size_data = {"labels": SIZE_LABELS, "values": [extract_metric(parsed[file]) for file in size_files]}
 
-def process_quality_benchmarks(result_files: List[str]) -> Dict[str, Any]:
-    """Process benchmarks for different quality settings."""
     quality_data = {
-        "formats": ["jpeg", "webp", "avif"],
-        "qualities": [60, 75, 85, 95],
-        "values": []
+        "formats": FORMATS,
+        "qualities": QUALITIES,
+        "values": [
+            [
+                extract_metric(parsed[quality_files[(format_name, quality)]])
+                if (format_name, quality) in quality_files
+                else None
+                for quality in QUALITIES
+            ]
+            for format_name in FORMATS
+        ]
     }
-    
-    for format_name in quality_data["formats"]:
-        format_values = []
-        for quality in quality_data["qualities"]:
-            matching_files = [f for f in result_files if f"quality_{quality}" in f and format_name in f]
-            if matching_files:
-                data = load_criterion_data(matching_files[0])
-                format_values.append(extract_metric(data))
-            else:
-                format_values.append(None)
-        quality_data["values"].append(format_values)
-    
-    return quality_data
+
+    return {"formats": format_data, "sizes": size_data, "quality": quality_data}
 
 def calculate_statistics(data: List[float]) -> Dict[str, float]:
     """Calculate basic statistics for a series of measurements."""
@@ -100,16 +113,8 @@ def main():
     
     # Process data for each crate
     dashboard_data = {
-        "image-optimize": {
-            "formats": process_format_benchmarks(optimize_files),
-            "sizes": process_size_benchmarks(optimize_files),
-            "quality": process_quality_benchmarks(optimize_files)
-        },
-        "image-build": {
-            "formats": process_format_benchmarks(build_files),
-            "sizes": process_size_benchmarks(build_files),
-            "quality": process_quality_benchmarks(build_files)
-        }
+        "image-optimize": process_benchmarks(optimize_files),
+        "image-build": process_benchmarks(build_files)
     }
     
     # Calculate statistics and detect regressions
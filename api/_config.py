@@ -2,13 +2,19 @@ import yaml
 
 from api._filesystem import cached_file_read, get_config_path
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def get_site_config() -> dict:
     """Get the site config."""
     try:
         config_path = get_config_path("site.yml")
         config_content = cached_file_read(config_path)
-        return yaml.safe_load(config_content)
+        return yaml.load(config_content, Loader=YamlLoader)
     except Exception:
         raise Exception(f"Failed to load site config: {config_path}") from None
 
@@ -18,7 +24,7 @@ def get_feeds_config() -> dict:
     try:
         config_path = get_config_path("feeds.yml")
         config_content = cached_file_read(config_path)
-        return yaml.safe_load(config_content)
+        return yaml.load(config_content, Loader=YamlLoader)
     except Exception:
         return {}
 
@@ -28,6 +34,6 @@ def get_llms_config() -> dict:
     try:
         config_path = get_config_path("llms.yml")
         config_content = cached_file_read(config_path)
-        return yaml.safe_load(config_content)
+        return yaml.load(config_content, Loader=YamlLoader)
     except Exception:
         return {}
@@ -1,28 +1,97 @@
 import os
 import re
-from datetime import datetime
-from functools import lru_cache
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time
 
-import frontmatter
+import yaml
 
-from api._filesystem import cached_file_exists, cached_file_read, get_content_dir
+from api._config import YamlLoader
+from api._filesystem import cached_file_read, get_content_dir, scan_dir_cached
 from api._types import Page, ReadingItem
 
+# A frontmatter delimiter line: three or more dashes, optionally followed by whitespace
+_FRONTMATTER_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+MAX_PAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Parsed pages keyed by (path, slug) as (mtime_ns, page), least recently used first
+_page_cache: OrderedDict[tuple[str, str], tuple[int, Page]] = OrderedDict()
+_page_cache_bytes = 0
+_page_cache_lock = threading.Lock()
+
+# Match # or ## at start of line, not followed by another #
+_TOP_HEADING = re.compile(r"^(#{1,2})(?!\#)", re.MULTILINE)
+
+
+def _split_frontmatter(content: str) -> tuple[dict, str]:
+    """Split a markdown document into its YAML frontmatter and body.
+
+    Only the block between the first two delimiters is handed to the YAML parser;
+    the body is sliced out as-is. Documents without frontmatter return an empty
+    dict and the whole text.
+    """
+    text = content.strip()
+
+    if not _FRONTMATTER_BOUNDARY.match(text):
+        return {}, text
+
+    parts = _FRONTMATTER_BOUNDARY.split(text, 2)
+    if len(parts) < 3:
+        return {}, text
+
+    metadata = yaml.load(parts[1], Loader=YamlLoader)
+
+    return (metadata if isinstance(metadata, dict) else {}), parts[2].strip()
+
 
-@lru_cache(maxsize=1024)
 def _page(path: str, slug: str) -> Page:
-    """Get a page."""
-    if not cached_file_exists(path):
-        raise Exception("File not found")
+    """Get a page.
+
+    Parsed pages are cached until the file's mtime changes. The cache holds at most
+    MAX_PAGE_CACHE_BYTES of page bodies, evicting the least recently used pages first.
+    """
+    global _page_cache_bytes
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        raise FileNotFoundError("File not found") from None
+
+    key = (path, slug)
+
+    with _page_cache_lock:
+        cached = _page_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            _page_cache.move_to_end(key)
+            return cached[1]
 
+    page = _load_page(path, slug)
+
+    with _page_cache_lock:
+        previous = _page_cache.pop(key, None)
+        if previous is not None:
+            _page_cache_bytes -= len(previous[1].body)
+
+        _page_cache[key] = (mtime, page)
+        _page_cache_bytes += len(page.body)
+
+        while _page_cache_bytes > MAX_PAGE_CACHE_BYTES and len(_page_cache) > 1:
+            _, (_, evicted) = _page_cache.popitem(last=False)
+            _page_cache_bytes -= len(evicted.body)
+
+    return page
+
+
+def _load_page(path: str, slug: str) -> Page:
+    """Parse a page from disk."""
     try:
         content = cached_file_read(path)
-        post = frontmatter.loads(content)
-        markdown_content = post.content
+        metadata, markdown_content = _split_frontmatter(content)
 
         page_slug: str = slug
-        page_title: str = str(post.get("title", slug.replace("-", " ").title()))
-        page_description: str | None = post.get("description", None)
+        page_title: str = str(metadata.get("title", slug.replace("-", " ").title()))
+        page_description: str | None = metadata.get("description", None)
         page_created: datetime | None = None
         page_updated: datetime | None = None
         page_tags: list[str] = []
@@ -52,32 +121,25 @@ def _page(path: str, slug: str) -> Page:
             if first_dir != page_slug:
                 page_topic = first_dir.capitalize()
 
-        _tags = post.get("tags", None)
-        _created = post.get("created", None)
-        _updated = post.get("updated", None)
-        _banner = post.get("banner", None)
-        _type = post.get("type", None)
-        _reading = post.get("reading", None)
-
-        if type(_tags) is list:
-            page_tags = _tags
-
-        if type(_created) is str:
-            page_created = datetime.strptime(_created, "%Y-%m-%d")
-
-        if type(_updated) is str:
-            page_updated = datetime.strptime(_updated, "%Y-%m-%d")
-
-        if type(_banner) is str:
-            page_banner = _banner
-
-        if type(_type) is str:
-            page_type = _type
-
-        if type(_reading) is list:
-            for item in _reading:
-                if type(item) is dict and "title" in item and "author" in item and "url" in item:
-                    page_reading.append(ReadingItem(title=item["title"], author=item["author"], url=item["url"]))
+        # Optional fields are only taken when they have the expected type
+        for key, value in metadata.items():
+            match key:
+                case "tags" if isinstance(value, list):
+                    page_tags = value
+                case "created" if isinstance(value, str):
+                    page_created = _parse_date(value)
+                case "updated" if isinstance(value, str):
+                    page_updated = _parse_date(value)
+                case "banner" if isinstance(value, str):
+                    page_banner = value
+                case "type" if isinstance(value, str):
+                    page_type = value
+                case "reading" if isinstance(value, list):
+                    page_reading = [
+                        ReadingItem(title=item["title"], author=item["author"], url=item["url"])
+                        for item in value
+                        if isinstance(item, dict) and "title" in item and "author" in item and "url" in item
+                    ]
 
         return Page(
             slug=page_slug,
@@ -99,6 +161,14 @@ def _page(path: str, slug: str) -> Page:
         raise Exception("File not found") from None
 
 
+def _parse_date(value: str) -> datetime:
+    """Parse a frontmatter date, accepting unpadded forms like 2024-1-5 as strptime does."""
+    try:
+        return datetime.combine(date.fromisoformat(value), time.min)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d")
+
+
 def _pages(directory: str) -> list[Page]:
     """Get all pages in a directory."""
     pages: list[Page] = []
@@ -106,18 +176,28 @@ def _pages(directory: str) -> list[Page]:
     if not os.path.exists(directory):
         return pages
 
-    for item in os.listdir(directory):
-        item_path = os.path.join(directory, item)
+    # Walk the tree depth-first with an explicit stack of listings, descending into each
+    # subdirectory as soon as it is listed, so pages are found in the same order as a
+    # recursive walk; cached listings carry each entry's type, so no extra stat per item
+    stack = [(directory, iter(scan_dir_cached(directory)))]
+
+    while stack:
+        current, entries = stack[-1]
+        parent_dir_name = os.path.basename(current)
 
-        if os.path.isdir(item_path):
-            pages.extend(_pages(item_path))
+        for name, is_dir in entries:
+            if is_dir:
+                subdirectory = os.path.join(current, name)
+                stack.append((subdirectory, iter(scan_dir_cached(subdirectory))))
+                break
 
-        elif item.endswith(".md"):
-            parent_dir_name = os.path.basename(directory)
-            file_name_without_ext = item[:-3]
+            if name.endswith(".md"):
+                file_name_without_ext = name[:-3]
 
-            if file_name_without_ext == parent_dir_name:
-                pages.append(_page(item_path, file_name_without_ext))
+                if file_name_without_ext == parent_dir_name:
+                    pages.append(_page(os.path.join(current, name), file_name_without_ext))
+        else:
+            stack.pop()
 
     def get_sort_key(page: Page) -> datetime:
         return page.updated or page.created or datetime.min
@@ -129,5 +209,4 @@ def _pages(directory: str) -> list[Page]:
 
 def ensure_heading_levels(markdown_text: str) -> str:
     """Ensure heading levels are consistent."""
-    pattern = r"^(#{1,2})(?!\#)"  # Match # or ## at start of line, not followed by another #
-    return re.sub(pattern, r"###", markdown_text, flags=re.MULTILINE)
+    return _TOP_HEADING.sub("###", markdown_text)
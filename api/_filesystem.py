@@ -1,25 +1,134 @@
-import glob
+import heapq
 import os
+import threading
+from collections import OrderedDict
 from functools import lru_cache
+from operator import itemgetter
+
+MAX_READ_CACHE_BYTES = 32 * 1024 * 1024
+MAX_EXISTS_CACHE_ENTRIES = 1024
+
+
+def _compute_project_root() -> str:
+    current_dir = os.path.abspath(os.path.dirname(__file__))
+    markers = [".git", "pyproject.toml"]
+
+    while True:
+        if any(os.path.exists(os.path.join(current_dir, marker)) for marker in markers):
+            return current_dir
+
+        parent_dir = os.path.dirname(current_dir)
+
+        if parent_dir == current_dir:
+            raise FileNotFoundError("Project root not found.")
+
+        current_dir = parent_dir
+
+
+# Resolved once at import; these never change for the lifetime of the process
+PROJECT_ROOT = _compute_project_root()
+CONTENT_DIR = os.path.join(PROJECT_ROOT, "content")
+CONFIG_DIR = os.path.join(PROJECT_ROOT, "configuration")
+
+# Directory listings keyed by path, revalidated against the directory's mtime
+_dir_listing_cache: dict[str, tuple[int, list[tuple[str, bool]]]] = {}
+
+# File contents as (mtime_ns, size, content), least recently used first
+_read_cache: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+_read_cache_bytes = 0
+_read_cache_lock = threading.Lock()
+
+# File existence as (parent directory mtime_ns, exists)
+_exists_cache: dict[str, tuple[int, bool]] = {}
 
 
-@lru_cache(maxsize=1024)
 def cached_file_exists(path: str) -> bool:
-    return os.path.exists(path)
+    """Check whether a file exists.
+
+    The answer is reused until the parent directory's mtime changes, which
+    happens whenever an entry is created, removed or renamed in it.
+    """
+    try:
+        parent_mtime = os.stat(os.path.dirname(path)).st_mtime_ns
+    except OSError:
+        return False
+
+    cached = _exists_cache.get(path)
+    if cached is not None and cached[0] == parent_mtime:
+        return cached[1]
+
+    exists = os.path.exists(path)
+
+    if path not in _exists_cache and len(_exists_cache) >= MAX_EXISTS_CACHE_ENTRIES:
+        _exists_cache.pop(next(iter(_exists_cache)), None)
+    _exists_cache[path] = (parent_mtime, exists)
+
+    return exists
 
 
-@lru_cache(maxsize=1024)
 def cached_file_read(path: str) -> str:
+    """Read a text file.
+
+    Contents are reused while the file's mtime and size are unchanged. The cache
+    holds at most MAX_READ_CACHE_BYTES, evicting the least recently read files first.
+    """
+    global _read_cache_bytes
+
+    stat = os.stat(path)
+
+    with _read_cache_lock:
+        cached = _read_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _read_cache.move_to_end(path)
+            return cached[2]
+
     with open(path) as f:
-        return f.read()
+        content = f.read()
+
+    with _read_cache_lock:
+        previous = _read_cache.pop(path, None)
+        if previous is not None:
+            _read_cache_bytes -= previous[1]
+
+        _read_cache[path] = (stat.st_mtime_ns, stat.st_size, content)
+        _read_cache_bytes += stat.st_size
+
+        while _read_cache_bytes > MAX_READ_CACHE_BYTES and len(_read_cache) > 1:
+            _, (_, evicted_size, _) = _read_cache.popitem(last=False)
+            _read_cache_bytes -= evicted_size
+
+    return content
+
+
+def scan_dir_cached(path: str) -> list[tuple[str, bool]]:
+    """List a directory as (name, is_dir) pairs.
+
+    The listing is reused for as long as the directory's mtime is unchanged, so a
+    warm lookup costs a single stat instead of re-reading every entry.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _dir_listing_cache.get(path)
+
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir(path) as entries:
+        listing = [(entry.name, entry.is_dir(follow_symlinks=False)) for entry in entries]
+
+    _dir_listing_cache[path] = (mtime, listing)
+    return listing
 
 
-@lru_cache(maxsize=1024)
 def get_content_dir(path: str | None = None) -> str:
     if path is None:
-        return os.path.abspath(os.path.join(get_project_root(), "content"))
-    else:
-        return os.path.abspath(os.path.join(get_project_root(), "content", path))
+        return CONTENT_DIR
+
+    return _content_subdir(path)
+
+
+@lru_cache(maxsize=1024)
+def _content_subdir(path: str) -> str:
+    return os.path.abspath(os.path.join(CONTENT_DIR, path))
 
 
 @lru_cache(maxsize=1024)
@@ -33,40 +142,78 @@ def get_config_path(config_name: str) -> str:
         The absolute path to the configuration file
 
     """
-    return os.path.abspath(os.path.join(get_project_root(), "configuration", config_name))
+    return os.path.abspath(os.path.join(CONFIG_DIR, config_name))
 
-@lru_cache(maxsize=1024)
-def get_project_root():
-    current_dir = os.path.abspath(os.path.dirname(__file__))
-    markers = ['.git', 'pyproject.toml']
 
-    while True:
-        if any(os.path.exists(os.path.join(current_dir, marker)) for marker in markers):
-            return current_dir
+def get_project_root() -> str:
+    return PROJECT_ROOT
 
-        parent_dir = os.path.dirname(current_dir)
 
-        if parent_dir == current_dir:
-            raise FileNotFoundError("Project root not found.")
+def _walk_content_files(root: str, file_extension: str) -> list[tuple[str, float]]:
+    """Collect (path, mtime) pairs for files under root with the given extension.
 
-        current_dir = parent_dir
+    Hidden files and directories are skipped, matching glob's behaviour.
+    """
+    suffix = f".{file_extension}"
+    found: list[tuple[str, float]] = []
+    pending = [root]
+
+    while pending:
+        directory = pending.pop()
+
+        try:
+            listing = scan_dir_cached(directory)
+        except OSError:
+            continue
+
+        for name, is_dir in listing:
+            if name.startswith("."):
+                continue
 
-def get_sorted_content_files(max_files: int = None, file_extension: str = "md") -> list[str]:
+            path = os.path.join(directory, name)
+
+            if is_dir:
+                pending.append(path)
+            elif name.endswith(suffix):
+                # The single stat per matching file; callers sort on this value rather than
+                # calling getmtime again. It is not cached with the listing because editing a
+                # file in place does not change its directory's mtime.
+                found.append((path, os.stat(path).st_mtime))
+
+    return found
+
+
+def get_sorted_content_files(
+    max_files: int | None = None, file_extension: str = "md", subpath: str | None = None
+) -> list[str]:
     """Get content files sorted by modification time (newest first).
 
     Args:
         max_files: Maximum number of files to return (default: all files)
         file_extension: File extension to filter by, without the dot (default: "md")
+        subpath: Directory under the content directory to limit the search to (default: everything)
 
     Returns:
         List of file paths sorted by modification time (newest first)
 
+    Raises:
+        ValueError: If subpath resolves outside of the content directory
+
     """
     content_path = get_content_dir()
-    content_files = glob.glob(f"{content_path}/**/*.{file_extension}", recursive=True)
-    sorted_files = sorted(content_files, key=os.path.getmtime, reverse=True)
+    root = content_path
+
+    if subpath:
+        root = os.path.abspath(os.path.join(content_path, subpath))
+
+        if os.path.commonpath([content_path, root]) != content_path:
+            raise ValueError(f"Path is outside of the content directory: {subpath}")
+
+    content_files = _walk_content_files(root, file_extension)
 
     if max_files is not None:
-        sorted_files = sorted_files[:max_files]
+        newest = heapq.nlargest(max_files, content_files, key=itemgetter(1))
+    else:
+        newest = sorted(content_files, key=itemgetter(1), reverse=True)
 
-    return sorted_files
+    return [path for path, _ in newest]
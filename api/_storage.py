@@ -6,17 +6,52 @@ from Vercel's blog storage system.
 
 import asyncio
 import os
-from urllib.parse import quote, urljoin
+import random
+from collections import OrderedDict
+from collections.abc import AsyncIterable
+from functools import lru_cache
+from urllib.parse import quote
 
 import dotenv
 import httpx
+import orjson
 
 # Constants for Vercel Blob API
 BLOB_API_BASE_URL = "https://blob.vercel-storage.com"
 API_VERSION = "7"
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY = 1  # seconds
+MAX_RETRY_DELAY = 30.0  # seconds
 DEFAULT_CACHE_AGE = "31536000"  # 1 year in seconds
+DEFAULT_TIMEOUT = 30.0  # seconds
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_ETAG_CACHE_BYTES = 32 * 1024 * 1024  # total body bytes kept for conditional reads
+MAX_ETAG_CACHE_ENTRY_BYTES = 1024 * 1024  # larger bodies, like full-page audio, are not kept
+DEFAULT_BATCH_CONCURRENCY = 16  # in-flight requests for read_files/write_files
+
+
+MIME_TYPES = {".mp3": "audio/mpeg", ".json": "application/json", ".txt": "text/plain"}
+
+
+@lru_cache(maxsize=64)
+def _guess_mime_type(path: str) -> str:
+    """Guess the MIME type based on file extension."""
+    ext = os.path.splitext(path)[1].lower()
+    return MIME_TYPES.get(ext, "application/octet-stream")
+
+
+@lru_cache(maxsize=2048)
+def _clean_path(path: str) -> str:
+    """Clean and encode the path for storage."""
+    # Remove leading/trailing slashes
+    path = path.strip("/")
+    # Normalize path separators to forward slashes
+    path = path.replace("\\", "/")
+    # URL encode each path segment while preserving slashes
+    segments = path.split("/")
+    encoded_segments = [quote(segment, safe="") for segment in segments]
+    return "/".join(encoded_segments)
 
 
 class StorageError(Exception):
@@ -46,28 +81,182 @@ class StorageClient:
         if not self.token:
             raise StorageError("No auth token provided or found in environment")
 
+        self._base_url_slash = self.base_url.rstrip("/") + "/"
+
+        self.concurrency = int(os.getenv("BLOB_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY))
+
         # Base headers that are always needed
         self.base_headers = {
             "Authorization": f"Bearer {self.token}",
             "x-api-version": API_VERSION,
         }
 
+        # Extra headers for uploads; only x-content-type varies per call
+        self._write_headers = {
+            "access": "public",  # Required for public access
+            "x-cache-control-max-age": DEFAULT_CACHE_AGE,
+            "x-add-random-suffix": "0",
+        }
+
+        # One pooled client so connections are kept alive between calls
+        self._client = self._create_client()
+
+        # Last (etag, body) seen per cleaned path, least recently used first
+        self._etag_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._etag_cache_bytes = 0
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client; HTTP/2 lets concurrent batch requests multiplex over one connection."""
+        return httpx.AsyncClient(
+            headers=self.base_headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+            timeout=DEFAULT_TIMEOUT,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client, re-created if an earlier app lifespan closed it.
+
+        The module-level instance outlives any one app, so a closed client is replaced on next use
+        rather than failing every later call with httpx's RuntimeError.
+        """
+        if self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def _backoff(self, attempt: int) -> None:
+        """Sleep before a retry using exponential backoff with full jitter.
+
+        Randomising the whole delay keeps clients that failed together from retrying in lockstep.
+        """
+        await asyncio.sleep(random.uniform(0, min(MAX_RETRY_DELAY, DEFAULT_RETRY_DELAY * (2**attempt))))
+
+    @staticmethod
+    def _error_details(response: httpx.Response) -> str | None:
+        """Extract the error message from a failed response body."""
+        try:
+            return orjson.loads(response.content).get("error", {}).get("message")
+        except Exception:
+            return response.text
+
+    def _remember_etag(self, path: str, response: httpx.Response) -> None:
+        """Keep a response body for conditional reads if the server sent an ETag.
+
+        The cache holds at most MAX_ETAG_CACHE_BYTES of bodies, evicting the least recently
+        used first; bodies over MAX_ETAG_CACHE_ENTRY_BYTES are never kept.
+        """
+        self._forget_etag(path)
+
+        etag = response.headers.get("etag")
+        body = response.content
+        if not etag or len(body) > MAX_ETAG_CACHE_ENTRY_BYTES:
+            return
+
+        self._etag_cache[path] = (etag, body)
+        self._etag_cache_bytes += len(body)
+
+        while self._etag_cache_bytes > MAX_ETAG_CACHE_BYTES:
+            _, (_, evicted) = self._etag_cache.popitem(last=False)
+            self._etag_cache_bytes -= len(evicted)
+
+    def _forget_etag(self, path: str) -> None:
+        """Drop any cached body for path."""
+        cached = self._etag_cache.pop(path, None)
+        if cached is not None:
+            self._etag_cache_bytes -= len(cached[1])
+
     def _guess_mime_type(self, path: str) -> str:
         """Guess the MIME type based on file extension."""
-        mime_types = {".mp3": "audio/mpeg", ".json": "application/json", ".txt": "text/plain"}
-        ext = os.path.splitext(path)[1].lower()
-        return mime_types.get(ext, "application/octet-stream")
+        return _guess_mime_type(path)
 
     def _clean_path(self, path: str) -> str:
         """Clean and encode the path for storage."""
-        # Remove leading/trailing slashes
-        path = path.strip("/")
-        # Normalize path separators to forward slashes
-        path = path.replace("\\", "/")
-        # URL encode each path segment while preserving slashes
-        segments = path.split("/")
-        encoded_segments = [quote(segment, safe="") for segment in segments]
-        return "/".join(encoded_segments)
+        return _clean_path(path)
+
+    async def _request(
+        self, method: str, url: str, *, action: str, attempts: int = DEFAULT_RETRY_ATTEMPTS, **kwargs: object
+    ) -> httpx.Response:
+        """Send a request, retrying network errors and 503s with backoff.
+
+        Args:
+            method: HTTP method to use.
+            url: Absolute URL to request.
+            action: What the request does ("reading", "writing"), used in network error messages.
+            attempts: Maximum number of attempts.
+            **kwargs: Passed through to httpx.AsyncClient.request.
+
+        Returns:
+            The response; callers handle any status other than 400, 401 and retried 503s.
+
+        Raises:
+            StorageError: On a bad request, an invalid token, or when the network keeps failing.
+
+        """
+        request = self.client.request
+        for attempt in range(attempts):
+            try:
+                response = await request(method, url, **kwargs)
+            except httpx.RequestError as e:
+                if attempt < attempts - 1:
+                    await self._backoff(attempt)
+                    continue
+                raise StorageError(f"Network error {action} file: {e}") from e
+
+            if response.status_code == 503 and attempt < attempts - 1:
+                await self._backoff(attempt)
+                continue
+
+            # Handle errors common to every endpoint
+            if response.status_code == 400:
+                raise StorageError(f"Bad request: {self._error_details(response)}")
+            elif response.status_code == 401:
+                raise StorageError("Unauthorized: Invalid token")
+
+            return response
+
+        raise StorageError("Max retry attempts reached")
+
+    def public_url(self, path: str, download: bool = False) -> str:
+        """Return the public URL a stored file can be downloaded from directly.
+
+        Args:
+            path: Path to the file relative to the storage root
+            download: Ask the blob store to serve the file as an attachment rather than inline
+
+        Returns:
+            str: The file's URL on the blob read domain
+
+        """
+        url = f"{self._base_url_slash}{self._clean_path(path)}"
+        return f"{url}?download=1" if download else url
+
+    async def head(self, path: str) -> int | None:
+        """Check whether a file exists without downloading it.
+
+        Args:
+            path: Path to the file relative to the storage root
+
+        Returns:
+            int | None: The file's size in bytes, or None if it does not exist
+
+        Raises:
+            StorageError: If the storage service cannot be queried
+
+        """
+        url = f"{self._base_url_slash}{self._clean_path(path)}"
+        response = await self._request("HEAD", url, action="checking")
+
+        if response.status_code == 200:
+            return int(response.headers.get("content-length", 0))
+        elif response.status_code == 404:
+            return None
+
+        raise StorageError(f"Storage error (HTTP {response.status_code}): {self._error_details(response)}")
 
     async def read_file(self, path: str) -> bytes:
         """Read a file from storage.
@@ -83,56 +272,34 @@ class StorageClient:
 
         """
         path = self._clean_path(path)
-        url = urljoin(self.base_url, path)
+        url = f"{self._base_url_slash}{path}"
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "x-api-version": API_VERSION,
-        }
+        # Revalidate instead of re-downloading when we already hold a copy
+        cached = self._etag_cache.get(path)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
 
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(url, headers=headers)
-
-                    # Try to get detailed error information
-                    error_details = None
-                    try:
-                        error_data = response.json()
-                        error_details = error_data.get("error", {}).get("message")
-                    except Exception:
-                        error_details = response.text
-
-                    if response.status_code == 200:
-                        return response.content
-                    elif response.status_code == 503 and attempt < DEFAULT_RETRY_ATTEMPTS - 1:
-                        await asyncio.sleep(DEFAULT_RETRY_DELAY * (2**attempt))
-                        continue
-
-                    # Handle specific error cases
-                    if response.status_code == 400:
-                        raise StorageError(f"Bad request: {error_details}")
-                    elif response.status_code == 401:
-                        raise StorageError("Unauthorized: Invalid token")
-                    elif response.status_code == 404:
-                        raise StorageError(f"File not found: {path}")
-                    else:
-                        raise StorageError(f"Storage error (HTTP {response.status_code}): {error_details}")
+        response = await self._request("GET", url, action="reading", headers=headers)
 
-            except httpx.RequestError as e:
-                if attempt < DEFAULT_RETRY_ATTEMPTS - 1:
-                    await asyncio.sleep(DEFAULT_RETRY_DELAY * (2**attempt))
-                    continue
-                raise StorageError(f"Network error reading file: {e}") from e
+        if response.status_code == 304 and cached is not None:
+            self._etag_cache.move_to_end(path)
+            return cached[1]
+        elif response.status_code == 200:
+            self._remember_etag(path, response)
+            return response.content
+        elif response.status_code == 404:
+            raise StorageError(f"File not found: {path}")
 
-        raise StorageError("Max retry attempts reached")
+        raise StorageError(f"Storage error (HTTP {response.status_code}): {self._error_details(response)}")
 
-    async def write_file(self, path: str, data: str | bytes) -> None:
+    async def write_file(self, path: str, data: str | bytes | AsyncIterable[bytes]) -> None:
         """Write data to a file in storage.
 
+        Async iterables are streamed with chunked transfer encoding rather than buffered in
+        memory. A stream can only be consumed once, so those uploads are not retried.
+
         Args:
             path: The path to write to
-            data: The data to write (string or bytes)
+            data: The data to write (string, bytes, or an async iterable of byte chunks)
 
         Raises:
             StorageError: If there is an error writing to storage
@@ -140,60 +307,72 @@ class StorageClient:
         """
         # Clean and prepare the path
         path = self._clean_path(path)
+        self._forget_etag(path)
 
         # Convert string data to bytes if needed
         if isinstance(data, str):
             data = data.encode("utf-8")
 
         # Set up headers based on the Vercel Blob API requirements
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "access": "public",  # Required for public access
-            "x-api-version": API_VERSION,
-            "x-content-type": self._guess_mime_type(path),
-            "x-cache-control-max-age": DEFAULT_CACHE_AGE,
-            "x-add-random-suffix": "0",
-        }
+        headers = {**self._write_headers, "x-content-type": self._guess_mime_type(path)}
 
-        # Attempt the upload with retries
-        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
-            try:
-                async with httpx.AsyncClient() as client:
-                    # PUT directly to the path, NOT to /store
-                    url = f"{BLOB_API_BASE_URL}/{path}"
-                    response = await client.put(url, headers=headers, content=data)
-
-                    # Try to get detailed error information
-                    error_details = None
-                    try:
-                        error_data = response.json()
-                        error_details = error_data.get("error", {}).get("message")
-                    except Exception:
-                        error_details = response.text
-
-                    if response.status_code == 200:
-                        return
-                    elif response.status_code == 503 and attempt < DEFAULT_RETRY_ATTEMPTS - 1:
-                        await asyncio.sleep(DEFAULT_RETRY_DELAY * (2**attempt))
-                        continue
-
-                    # Handle specific error cases
-                    if response.status_code == 400:
-                        raise StorageError(f"Bad request: {error_details}")
-                    elif response.status_code == 401:
-                        raise StorageError("Unauthorized: Invalid token")
-                    elif response.status_code == 413:
-                        raise StorageError("File too large")
-                    else:
-                        raise StorageError(f"Storage error (HTTP {response.status_code}): {error_details}")
+        # PUT directly to the path, NOT to /store
+        response = await self._request(
+            "PUT",
+            f"{BLOB_API_BASE_URL}/{path}",
+            action="writing",
+            attempts=DEFAULT_RETRY_ATTEMPTS if isinstance(data, bytes) else 1,
+            headers=headers,
+            content=data,
+        )
 
-            except httpx.RequestError as e:
-                if attempt < DEFAULT_RETRY_ATTEMPTS - 1:
-                    await asyncio.sleep(DEFAULT_RETRY_DELAY * (2**attempt))
-                    continue
-                raise StorageError(f"Network error writing file: {e}") from e
+        if response.status_code == 200:
+            return
+        elif response.status_code == 413:
+            raise StorageError("File too large")
 
-        raise StorageError("Max retry attempts reached")
+        raise StorageError(f"Storage error (HTTP {response.status_code}): {self._error_details(response)}")
+
+    async def read_files(self, paths: list[str], concurrency: int | None = None) -> list[bytes]:
+        """Read several files from storage concurrently.
+
+        Args:
+            paths: The paths to read.
+            concurrency: Maximum requests in flight. Defaults to BLOB_BATCH_CONCURRENCY.
+
+        Returns:
+            The file contents, in the same order as paths.
+
+        Raises:
+            StorageError: If any file cannot be read.
+
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def read_one(path: str) -> bytes:
+            async with semaphore:
+                return await self.read_file(path)
+
+        return await asyncio.gather(*(read_one(path) for path in paths))
+
+    async def write_files(self, items: dict[str, str | bytes], concurrency: int | None = None) -> None:
+        """Write several files to storage concurrently.
+
+        Args:
+            items: Mapping of path to the data to write there.
+            concurrency: Maximum requests in flight. Defaults to BLOB_BATCH_CONCURRENCY.
+
+        Raises:
+            StorageError: If any file cannot be written.
+
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def write_one(path: str, data: str | bytes) -> None:
+            async with semaphore:
+                await self.write_file(path, data)
+
+        await asyncio.gather(*(write_one(path, data) for path, data in items.items()))
 
     async def delete_file(self, path: str) -> None:
         """Delete a file from storage.
@@ -205,22 +384,38 @@ class StorageClient:
             StorageError: If the file cannot be deleted.
 
         """
-        clean_path = self._clean_path(path)
-        file_url = urljoin(BLOB_API_BASE_URL + "/", clean_path)
+        await self.delete_files([path])
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # Use POST with urls array as specified in Vercel Blob API
-                response = await client.post(
-                    f"{BLOB_API_BASE_URL}/delete",
-                    headers=self.base_headers,
-                    json={"urls": [file_url]},
-                )
-
-                if response.status_code != 200:
-                    raise StorageError(f"Failed to delete file: {path} (Status: {response.status_code})")
-            except httpx.RequestError as e:
-                raise StorageError(f"Network error deleting file: {e}") from e
+    async def delete_files(self, paths: list[str]) -> None:
+        """Delete several files from storage in a single request.
+
+        Args:
+            paths: Paths to the files to delete.
+
+        Raises:
+            StorageError: If the files cannot be deleted.
+
+        """
+        if not paths:
+            return
+
+        file_urls = []
+        for path in paths:
+            clean_path = self._clean_path(path)
+            self._forget_etag(clean_path)
+            file_urls.append(f"{BLOB_API_BASE_URL}/{clean_path}")
+
+        try:
+            # Use POST with urls array as specified in Vercel Blob API
+            response = await self.client.post(
+                f"{BLOB_API_BASE_URL}/delete",
+                json={"urls": file_urls},
+            )
+
+            if response.status_code != 200:
+                raise StorageError(f"Failed to delete file: {', '.join(paths)} (Status: {response.status_code})")
+        except httpx.RequestError as e:
+            raise StorageError(f"Network error deleting file: {e}") from e
 
 
 # Create a default client instance
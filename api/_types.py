@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from api._filesystem import get_content_dir
+from api._filesystem import CONTENT_DIR
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadingItem:
     title: str
     author: str
@@ -14,7 +14,26 @@ class ReadingItem:
         return {"title": self.title, "author": self.author, "url": self.url}
 
 
-@dataclass
+@dataclass(slots=True)
+class Chunk:
+    id: str
+    text: str
+    checksum: str
+    title: str | None = None
+    has_audio: bool | str = False
+    url: str | None = None
+
+    def json(self) -> dict:
+        # Optional keys are left out when unset, as in the dicts chunks used to be
+        data = {"id": self.id, "text": self.text, "checksum": self.checksum, "has_audio": self.has_audio}
+        if self.title is not None:
+            data["title"] = self.title
+        if self.url is not None:
+            data["url"] = self.url
+        return data
+
+
+@dataclass(slots=True)
 class Page:
     slug: str
     title: str
@@ -31,16 +50,10 @@ class Page:
     reading: list[ReadingItem] = field(default_factory=list)
 
     def url(self) -> str:
-        base_path = get_content_dir()
-        _url = self.path
-        if _url.startswith(base_path):
-            _url = _url[len(base_path) :]
-            if _url.startswith("/"):
-                _url = _url[1:]
+        _url = self.path.removeprefix(CONTENT_DIR).lstrip("/")
 
-        _url = _url.split("/")
-        _url.pop()
-        _url = "/".join(_url)
+        # Drop the last path component (the page's own file) without splitting
+        _url = _url[: max(_url.rfind("/"), 0)]
 
         return f"/{_url}"
 
@@ -61,7 +74,7 @@ class Page:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     name: str
     path: str
@@ -1,37 +1,69 @@
 import os
+import re
 from functools import lru_cache
 
 from fastapi import HTTPException
 
 from api._filesystem import get_content_dir
 
+_SLUG_CHARS = re.compile(r"[a-z0-9-]*")
+_PATH_CHARS = re.compile(r"[a-z0-9\-/]*")
+
+MAX_SAFE_PATH_CACHE_ENTRIES = 1024
+_safe_path_cache: dict[str, str] = {}
+
 
 @lru_cache(maxsize=1024)
 def is_valid_slug(slug: str) -> bool:
-    allowed = set("abcdefghijklmnopqrstuvwxyz0123456789-")
-    return all(c in allowed for c in slug.lower()) and 3 <= len(slug) <= 64
+    return 3 <= len(slug) <= 64 and _SLUG_CHARS.fullmatch(slug.lower()) is not None
 
 
 @lru_cache(maxsize=1024)
 def is_valid_path(slug: str) -> bool:
-    allowed = set("abcdefghijklmnopqrstuvwxyz0123456789-/")
-    return all(c in allowed for c in slug.lower()) and 3 <= len(slug) <= 64
+    return 3 <= len(slug) <= 64 and _PATH_CHARS.fullmatch(slug.lower()) is not None
+
+
+@lru_cache(maxsize=8)
+def _base_exists(base_path: str) -> bool:
+    return os.path.exists(base_path)
+
+
+@lru_cache(maxsize=8)
+def _normalized_base(base_path: str) -> str:
+    return os.path.normpath(base_path)
 
 
-@lru_cache(maxsize=1024)
 def safe_path(path: str, base_path: str | None = None) -> str:
-    if base_path is None:
-        base_path = get_content_dir()
+    if base_path is not None:
+        return _resolve_safe_path(path, base_path)
+
+    # Nearly every caller resolves against the content dir, so key that case on path alone
+    resolved = _safe_path_cache.get(path)
+    if resolved is None:
+        resolved = _resolve_safe_path(path, get_content_dir())
+        if len(_safe_path_cache) >= MAX_SAFE_PATH_CACHE_ENTRIES:
+            _safe_path_cache.pop(next(iter(_safe_path_cache)), None)
+        _safe_path_cache[path] = resolved
+
+    return resolved
 
+
+def _resolve_safe_path(path: str, base_path: str) -> str:
     target_path = get_content_dir(path)
 
-    if not os.path.exists(base_path):
+    if not _base_exists(base_path):
         raise HTTPException(status_code=400, detail="Base directory does not exist")
 
-    normalized_base = os.path.normpath(base_path)
+    normalized_base = _normalized_base(base_path)
     normalized_target = os.path.normpath(target_path)
 
-    if not normalized_target.startswith(normalized_base):
+    # commonpath rather than startswith so "/content" does not admit "/content-evil"
+    try:
+        contained = os.path.commonpath([normalized_base, normalized_target]) == normalized_base
+    except ValueError:
+        contained = False
+
+    if not contained:
         raise HTTPException(status_code=400, detail="Invalid path traversal attempt")
 
     return normalized_target
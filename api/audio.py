@@ -1,31 +1,46 @@
 import asyncio
+import collections
 import contextlib
 import hashlib
 import logging
 import os
 import re
+import shutil
+import threading
 import time
 from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from dataclasses import replace
+from functools import lru_cache
 from typing import Any
 
 import dotenv
-from elevenlabs.client import ElevenLabs
+import orjson
+from elevenlabs.client import AsyncElevenLabs
+from elevenlabs.core.api_error import ApiError
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from pydantic import BaseModel
 
 from api._content import _page
 from api._filesystem import cached_file_exists
 from api._storage import StorageError, storage
-from api._types import Page
+from api._types import Chunk, Page
 from api._validation import is_valid_slug, safe_path
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the shared storage client when the app shuts down."""
+    yield
+    await storage.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -44,15 +59,25 @@ VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID") or "bIHbv24MWmeRgasZH58o"
 MODEL_ID = os.getenv("ELEVENLABS_MODEL_ID") or "eleven_multilingual_v2"
 
 # Initialize Eleven Labs client
-client = ElevenLabs(api_key=API_KEY)
+client = AsyncElevenLabs(api_key=API_KEY)
 
-# File lock for preventing concurrent file operations on the same file
-file_locks: dict[str, asyncio.Lock] = {}
+
+# Audio generations in progress, so concurrent requests for the same file can share one
+audio_generations: dict[str, asyncio.Future[bytes]] = {}
+
+# Audio storage paths mirror the layout of the content directory next to this package
+AUDIO_CONTENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "content"))
+
+# Local audio directory listings, reused while the directory's mtime is unchanged
+MAX_AUDIO_LISTING_CACHE_ENTRIES = 1024
+_audio_listing_cache: dict[str, tuple[int, set[str]]] = {}
+_audio_listing_lock = threading.Lock()
 
 # Rate limiting settings
 RATE_LIMIT_CALLS = int(os.getenv("RATE_LIMIT_CALLS", "60"))  # Calls per minute
 RATE_LIMIT_WINDOW = 60  # 1 minute window in seconds
-rate_limit_data: dict[str, float | int] = {"calls": 0, "window_start": time.time()}
+_rate_limit_calls = 0
+_rate_limit_window_start = time.monotonic()
 
 
 # Pydantic models for request/response validation
@@ -71,32 +96,101 @@ class ChunkMetadata(BaseModel):
     checksum: str
     has_audio: bool
     title: str | None = None
+    url: str | None = None
+
 
+class Admission:
+    """Concurrency limiter whose limit can be changed while it is in use.
+
+    Works like asyncio.Semaphore, but keeps its own counter and queue of waiters so set_limit
+    can raise or lower the ceiling safely; waiters are admitted in order as room frees up.
+    release does not await, so a slot cannot leak when the releasing task is cancelled.
+    """
 
-# Concurrency control with a semaphore to limit simultaneous API calls
-API_SEMAPHORE = asyncio.Semaphore(3)  # Limit to 3 concurrent API calls
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._active = 0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+
+    @property
+    def limit(self) -> int:
+        """The current maximum number of concurrent holders."""
+        return self._limit
+
+    async def acquire(self) -> None:
+        """Wait until there is room, then take a slot."""
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as we were cancelled; pass it on
+                self.release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Give back a slot and admit the next waiter if there is room."""
+        self._active -= 1
+        self._admit_waiters()
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit; holders above a lowered limit finish normally."""
+        self._limit = limit
+        self._admit_waiters()
+
+    def _admit_waiters(self) -> None:
+        while self._waiters and self._active < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+
+    async def __aenter__(self) -> None:
+        """Acquire a slot for the duration of an async with block."""
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release the slot taken by __aenter__."""
+        self.release()
+
+
+# Concurrency control to limit simultaneous API calls. The limit halves whenever ElevenLabs
+# answers 429 Too Many Requests and climbs back by one per successful call.
+API_CONCURRENCY = int(os.getenv("ELEVENLABS_CONCURRENCY", "3"))  # Defaults to 3 concurrent API calls
+API_ADMISSION = Admission(API_CONCURRENCY)
 
 
 # Rate limiter middleware
 @app.middleware("http")
 async def rate_limiter(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
     """Middleware to implement rate limiting."""
-    global rate_limit_data
+    global _rate_limit_calls, _rate_limit_window_start
+
+    # The check and increment below never await, so they run atomically on the event loop
 
     # Reset counter if window has elapsed
-    current_time = time.time()
-    if current_time - rate_limit_data["window_start"] > RATE_LIMIT_WINDOW:
-        rate_limit_data = {"calls": 0, "window_start": current_time}
+    current_time = time.monotonic()
+    if current_time - _rate_limit_window_start > RATE_LIMIT_WINDOW:
+        _rate_limit_calls = 0
+        _rate_limit_window_start = current_time
 
     # Check if limit exceeded
-    if rate_limit_data["calls"] >= RATE_LIMIT_CALLS:
+    if _rate_limit_calls >= RATE_LIMIT_CALLS:
         return JSONResponse(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             content={"detail": "Rate limit exceeded. Please try again later."},
         )
 
     # Increment counter and process request
-    rate_limit_data["calls"] += 1
+    _rate_limit_calls += 1
     return await call_next(request)
 
 
@@ -107,10 +201,7 @@ async def error_handling_middleware(request: Request, call_next: Callable[[Reque
     try:
         return await call_next(request)
     except Exception as e:
-        logger.error(f"Unhandled exception: {str(e)}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.exception("Unhandled exception: %s", e)
 
         if isinstance(e, HTTPException):
             # Pass through HTTP exceptions
@@ -123,24 +214,68 @@ async def error_handling_middleware(request: Request, call_next: Callable[[Reque
         )
 
 
+class KeyedLock:
+    """Reference-counted pool of asyncio locks, one per key.
+
+    An entry lives for as long as any coroutine holds or waits on its key, so two callers can never
+    end up with different locks for the same path. Released locks are kept in a small free list and
+    reused. All bookkeeping happens between awaits, which makes it atomic on the event loop without
+    an extra guard lock.
+    """
+
+    def __init__(self, pool_size: int = 128) -> None:
+        self._entries: dict[str, list] = {}  # key -> [lock, refcount]
+        self._pool: list[asyncio.Lock] = []
+        self._pool_size = pool_size
+
+    async def acquire(self, key: str) -> None:
+        """Wait for the lock on key."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [self._pool.pop() if self._pool else asyncio.Lock(), 0]
+        entry[1] += 1
+
+        try:
+            await entry[0].acquire()
+        except BaseException:
+            self._unref(key, entry)
+            raise
+
+    def release(self, key: str) -> None:
+        """Release the lock on key, dropping its entry once nobody else needs it."""
+        entry = self._entries[key]
+        entry[0].release()
+        self._unref(key, entry)
+
+    def _unref(self, key: str, entry: list) -> None:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._entries[key]
+            if len(self._pool) < self._pool_size:
+                self._pool.append(entry[0])
+
+    @contextlib.asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        """Async context manager that holds the lock on key."""
+        await self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release(key)
+
+
+# File lock for preventing concurrent file operations on the same file
+file_locks = KeyedLock()
+
+
 @contextlib.asynccontextmanager
 async def file_lock(file_path: str) -> AsyncIterator[None]:
     """Async context manager for file locks to prevent race conditions."""
-    if file_path not in file_locks:
-        file_locks[file_path] = asyncio.Lock()
-
-    lock = file_locks[file_path]
-    try:
-        await lock.acquire()
+    async with file_locks.hold(file_path):
         yield
-    finally:
-        if lock.locked():
-            lock.release()
-        # Clean up if no one is waiting
-        if not lock.locked():
-            file_locks.pop(file_path, None)
 
 
+@lru_cache(maxsize=4096)
 def get_storage_path(file_path: str) -> str:
     """Convert filesystem path to storage path.
 
@@ -154,19 +289,15 @@ def get_storage_path(file_path: str) -> str:
         str: The storage path for the audio file
 
     """
-    # Get the path relative to the content directory
-    content_dir = os.path.join(os.path.dirname(__file__), "..", "content")
-
     try:
-        # Ensure the path is absolute before getting relative path
-        abs_path = os.path.abspath(file_path)
-        rel_path = os.path.relpath(abs_path, content_dir)
+        # Get the path relative to the content directory
+        rel_path = os.path.relpath(file_path, AUDIO_CONTENT_DIR)
 
         # Split the path into components
         parts = rel_path.split(os.sep)
 
         # For audio files, ensure they go in an audio subdirectory
-        if not any(p == "audio" for p in parts):
+        if "audio" not in parts:
             # If no audio directory in path, add it
             parts.insert(-1, "audio")
 
@@ -176,7 +307,7 @@ def get_storage_path(file_path: str) -> str:
     except ValueError:
         # If the path is not under content_dir, ensure it still goes in audio dir
         parts = file_path.split(os.sep)
-        if not any(p == "audio" for p in parts):
+        if "audio" not in parts:
             # Add audio directory before the filename
             parts.insert(-1, "audio")
         return "/".join(parts).replace("\\", "/")
@@ -191,44 +322,120 @@ def get_audio_dir(content_path: str) -> str:
     return os.path.join(content_dir, "audio")
 
 
+# Markdown patterns used when preparing page text for TTS
+_BLANK_LINES_RE = re.compile(r"\n\n+")
+_HEADER_RE = re.compile(r"^(#+)\s+(.+)$", re.MULTILINE)
+_EMPHASIS_RE = re.compile(r"\*\*|\*|__|\^")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_CODE_BLOCK_RE = re.compile(r"```[^`]*```")
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _find_h2_headings(content: str) -> list[tuple[str, int, str]]:
+    r"""Find level-two headings as (line, start, title) tuples.
+
+    Equivalent to re.finditer(r"^##\s+(.+)$", content, re.MULTILINE), including its quirks:
+    the whitespace after ## may span newlines, and a match consumes every line it spans.
+    """
+    headings = []
+    length = len(content)
+    start = 0 if content.startswith("##") else -1
+    search_from = 0
+
+    while True:
+        if start < 0:
+            newline = content.find("\n##", search_from)
+            if newline < 0:
+                break
+            start = newline + 1
+
+        title_start = start + 2
+        while title_start < length and content[title_start].isspace():
+            title_start += 1
+
+        if title_start == start + 2:
+            # "##" not followed by whitespace, e.g. a deeper heading
+            search_from = start
+            start = -1
+            continue
+
+        if title_start == length:
+            # Only whitespace remains; (.+) can still take its last non-newline character
+            title_start = length - 1
+            while title_start > start + 2 and content[title_start] == "\n":
+                title_start -= 1
+            if title_start == start + 2:
+                break
+
+        end = content.find("\n", title_start)
+        if end < 0:
+            end = length
+
+        headings.append((content[start:end], start, content[title_start:end].strip()))
+        search_from = end
+        start = -1
+
+    return headings
+
+
 async def split_content_into_chunks(
     content: str = "", title: str | None = None, description: str | None = None, page_path: str | None = None
-) -> list[dict]:
+) -> list[Chunk]:
     """Split markdown content into logical chunks based on h2 headings.
 
-    Returns a list of dictionaries with 'id', 'text', and 'checksum' for each chunk.
+    Returns a Chunk with an id, text, and checksum for each chunk.
     Each chunk contains all content from one h2 heading to the next h2 heading.
     The first chunk contains all content before the first h2 heading.
 
     If page_path is provided, will use _page function to parse frontmatter. Otherwise,
-    expects raw content with optional title and description parameters.
+    expects raw content with optional title and description parameters. Chunks for a
+    page are memoized on the file's mtime and size; callers get their own copies.
     """
-    # If a page path is provided, use the _page function to get the Page object
-    if page_path:
+    if not page_path:
+        return _compute_chunks(content, title, description)
+
+    try:
         try:
-            # Extract slug from the filename
-            slug = os.path.basename(page_path).replace(".md", "")
-            page = _page(page_path, slug)
-            content = page.body
-            if title is None:
-                title = page.title
-            if description is None and page.description:
-                description = page.description
-        except Exception as e:
-            logger.error(f"Error loading page from path {page_path}: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error loading page content: {str(e)}"
-            ) from e
+            stat = os.stat(page_path)
+        except OSError:
+            raise FileNotFoundError("File not found") from None  # same error _page reports
+        chunks = _chunks_for_page(page_path, title, description, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError as e:
+        # The page was removed after it was resolved
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Content file not found") from e
+    except Exception as e:
+        logger.error(f"Error loading page from path {page_path}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error loading page content: {str(e)}"
+        ) from e
+
+    return [replace(chunk) for chunk in chunks]
+
+
+@lru_cache(maxsize=256)
+def _chunks_for_page(
+    page_path: str, title: str | None, description: str | None, mtime_ns: int, size: int
+) -> tuple[Chunk, ...]:
+    """Load a page and split it into chunks; the stat fields only key the cache."""
+    # Extract slug from the filename
+    slug = os.path.basename(page_path).replace(".md", "")
+    page = _page(page_path, slug)
+    if title is None:
+        title = page.title
+    if description is None and page.description:
+        description = page.description
+
+    return tuple(_compute_chunks(page.body, title, description))
 
-    # Clean the content for better TTS processing
-    content = re.sub(r"\n\n+", "\n\n", content)  # Normalize line breaks
 
-    # Split content by h2 headings
-    # Match ## Heading patterns (with optional spaces after ##)
-    h2_pattern = r"(?m)^##\s+(.+)$"
+def _compute_chunks(content: str, title: str | None, description: str | None) -> list[Chunk]:
+    """Split already-loaded markdown into TTS chunks."""
+    # Clean the content for better TTS processing
+    content = _BLANK_LINES_RE.sub("\n\n", content)  # Normalize line breaks
 
     # Find all h2 headings and their positions
-    headings = [(m.group(0), m.start(), m.group(1).strip()) for m in re.finditer(h2_pattern, content)]
+    headings = _find_h2_headings(content)
 
     chunks = []
 
@@ -247,13 +454,13 @@ async def split_content_into_chunks(
             if intro_text:
                 clean_intro = clean_text_for_tts(intro_text)
                 if len(clean_intro) >= 3:  # Skip if too short
-                    checksum = hashlib.md5(clean_intro.encode("utf-8")).hexdigest()
+                    checksum = chunk_checksum(clean_intro)
                     chunks.append(
-                        {
-                            "id": "intro",
-                            "text": clean_intro,
-                            "checksum": checksum,
-                        }
+                        Chunk(
+                            id="intro",
+                            text=clean_intro,
+                            checksum=checksum,
+                        )
                     )
 
         # Process each heading and its content
@@ -270,14 +477,14 @@ async def split_content_into_chunks(
 
                 if len(clean_section) >= 3:  # Skip if too short
                     section_id = f"section_{i}"
-                    checksum = hashlib.md5(clean_section.encode("utf-8")).hexdigest()
+                    checksum = chunk_checksum(clean_section)
                     chunks.append(
-                        {
-                            "id": section_id,
-                            "text": clean_section,
-                            "title": heading_title,  # Store the heading title
-                            "checksum": checksum,
-                        }
+                        Chunk(
+                            id=section_id,
+                            text=clean_section,
+                            title=heading_title,  # Store the heading title
+                            checksum=checksum,
+                        )
                     )
     else:
         # No headings found, process the entire content as one chunk
@@ -285,13 +492,13 @@ async def split_content_into_chunks(
             full_text = intro_prefix + content.strip()
             clean_content = clean_text_for_tts(full_text)
             if len(clean_content) >= 3:
-                checksum = hashlib.md5(clean_content.encode("utf-8")).hexdigest()
+                checksum = chunk_checksum(clean_content)
                 chunks.append(
-                    {
-                        "id": "full_content",
-                        "text": clean_content,
-                        "checksum": checksum,
-                    }
+                    Chunk(
+                        id="full_content",
+                        text=clean_content,
+                        checksum=checksum,
+                    )
                 )
 
     return chunks
@@ -299,133 +506,300 @@ async def split_content_into_chunks(
 
 def clean_text_for_tts(text: str) -> str:
     """Clean text for TTS processing by removing markdown formatting."""
+    # Each pass substitutes entirely in C; a single fused pattern needs a Python callback per
+    # match (every whitespace run) and measured over twice as slow on the site's content.
+
     # First, capture header text and add pauses after them
-    clean_text = re.sub(r"^(#+)\s+(.+)$", r"\2. . . .", text, flags=re.MULTILINE)
+    clean_text = _HEADER_RE.sub(r"\2. . . .", text)
 
     # Remove any remaining markdown formatting
-    clean_text = re.sub(r"\*\*|\*|__|\^", "", clean_text)
+    clean_text = _EMPHASIS_RE.sub("", clean_text)
 
     # Convert links to just text
-    clean_text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", clean_text)
+    clean_text = _LINK_RE.sub(r"\1", clean_text)
 
     # Remove code blocks
-    clean_text = re.sub(r"```[^`]*```", " ", clean_text)
+    clean_text = _CODE_BLOCK_RE.sub(" ", clean_text)
 
     # Remove inline code
-    clean_text = re.sub(r"`([^`]+)`", r"\1", clean_text)
+    clean_text = _INLINE_CODE_RE.sub(r"\1", clean_text)
 
     # Remove excessive spaces
-    clean_text = re.sub(r"\s+", " ", clean_text).strip()
+    clean_text = _WHITESPACE_RE.sub(" ", clean_text).strip()
 
     return clean_text
 
 
+def chunk_checksum(text: str) -> str:
+    """Return the content identifier used to name a chunk's audio file."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def legacy_chunk_checksum(text: str) -> str:
+    """Return the MD5 identifier that chunk audio was stored under before BLAKE2b."""
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+async def read_chunk_audio(text: str, audio_path: str) -> bytes:
+    """Read a chunk's audio from storage, migrating it from its legacy MD5 name if needed.
+
+    Raises:
+        StorageError: If the audio exists under neither name
+
+    """
+    storage_path = get_storage_path(audio_path)
+    try:
+        return await storage.read_file(storage_path)
+    except StorageError:
+        pass
+
+    # Most misses are audio that was never generated; a HEAD rules the legacy name out without
+    # paying for a second GET
+    legacy_path = get_audio_path(os.path.dirname(audio_path), legacy_chunk_checksum(text))
+    legacy_storage_path = get_storage_path(legacy_path)
+    if not await storage.head(legacy_storage_path):
+        raise StorageError(f"File not found: {storage_path}")
+    audio_bytes = await storage.read_file(legacy_storage_path)
+
+    # Copy it under the new name so the next read finds it directly
+    try:
+        await storage.write_file(storage_path, audio_bytes)
+    except StorageError as e:
+        logger.warning(f"Could not migrate legacy audio file {legacy_path}: {str(e)}")
+
+    return audio_bytes
+
+
+async def read_stored_audio(audio_path: str) -> bytes | None:
+    """Return audio stored under audio_path, or None.
+
+    Only the exact path is tried; without the chunk's text there is no legacy MD5 name to
+    fall back to, so callers resolve misses through read_chunk_audio.
+    """
+    try:
+        return await storage.read_file(get_storage_path(audio_path))
+    except StorageError:
+        return None
+
+
+async def persist_audio(audio_path: str, audio_bytes: bytes) -> None:
+    """Write generated audio to storage, logging rather than raising on failure."""
+    try:
+        storage_path = get_storage_path(audio_path)
+        await storage.write_file(storage_path, audio_bytes)
+        logger.info("Saved audio file to %s", storage_path)
+    except StorageError as file_error:
+        logger.error(f"Error saving audio file: {str(file_error)}")
+        # Continue even if saving fails - the client already has the audio
+
+
 def get_audio_path(audio_dir: str, checksum: str) -> str:
     """Return the path to the audio file for a given content checksum."""
     return os.path.join(audio_dir, f"{checksum}.mp3")
 
 
+def has_local_audio(chunk: Chunk, present: set[str]) -> bool:
+    """Return whether a listing from list_local_audio holds the chunk's audio under either name."""
+    if not present:
+        return False
+    return f"{chunk.checksum}.mp3" in present or f"{legacy_chunk_checksum(chunk.text)}.mp3" in present
+
+
+def list_local_audio(audio_dir: str) -> set[str]:
+    """Return the names of the MP3 files in a local audio directory.
+
+    One directory scan answers "which chunks have audio" for a whole page, instead of a
+    stat per chunk. The result is reused until the directory's mtime changes, so a warm
+    lookup costs a single stat; a missing directory is not cached, since that stat fails
+    just as cheaply. Only names are listed: a file's size can change without touching the
+    directory's mtime, so it could not be cached safely. Runs on worker threads.
+    """
+    try:
+        mtime = os.stat(audio_dir).st_mtime_ns
+        with _audio_listing_lock:
+            cached = _audio_listing_cache.get(audio_dir)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with os.scandir(audio_dir) as entries:
+            present = {entry.name for entry in entries if entry.name.endswith(".mp3") and entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+    with _audio_listing_lock:
+        if audio_dir not in _audio_listing_cache and len(_audio_listing_cache) >= MAX_AUDIO_LISTING_CACHE_ENTRIES:
+            _audio_listing_cache.pop(next(iter(_audio_listing_cache)), None)
+        _audio_listing_cache[audio_dir] = (mtime, present)
+    return present
+
+
 def get_full_audio_path(audio_dir: str, page_slug: str) -> str:
     """Return the path to the full concatenated audio file for a page."""
     return os.path.join(audio_dir, f"{page_slug}_full.mp3")
 
 
+async def stream_text_to_speech(text: str) -> AsyncIterator[bytes]:
+    """Synthesize text with ElevenLabs, yielding audio chunks as they arrive.
+
+    Uses the streaming endpoint, which starts sending audio before the whole text has been
+    synthesized. A 429 response lowers the API_ADMISSION limit and a completed stream raises
+    it again, up to ELEVENLABS_CONCURRENCY.
+    """
+    try:
+        async for audio_chunk in client.text_to_speech.convert_as_stream(
+            text=text,
+            voice_id=VOICE_ID,
+            model_id=MODEL_ID,
+            output_format="mp3_44100_128",
+        ):
+            yield audio_chunk
+    except ApiError as e:
+        if e.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+            # Over the account's concurrency quota; back off before the caller retries
+            API_ADMISSION.set_limit(max(1, API_ADMISSION.limit // 2))
+            logger.warning("ElevenLabs rate limited the request, lowering concurrency to %d", API_ADMISSION.limit)
+        raise
+
+    if API_ADMISSION.limit < API_CONCURRENCY:
+        API_ADMISSION.set_limit(API_ADMISSION.limit + 1)
+
+
+async def text_to_speech(text: str) -> bytes:
+    """Synthesize text with ElevenLabs, returning the audio once all of it has arrived."""
+    audio_buffer = bytearray()
+    async for audio_chunk in stream_text_to_speech(text):
+        audio_buffer.extend(audio_chunk)
+    return bytes(audio_buffer)
+
+
 async def get_or_generate_audio(chunk_text: str, audio_path: str) -> AsyncGenerator[bytes, None]:
-    """Get existing audio file or generate new one using Eleven Labs."""
-    async with file_lock(audio_path):
-        try:
-            # Try to read from storage first
-            storage_path = get_storage_path(audio_path)
-            audio_bytes = await storage.read_file(storage_path)
-            if audio_bytes:
-                yield audio_bytes
-                return
-        except StorageError:
-            # File doesn't exist or is empty, continue to generation
-            pass
+    """Get existing audio file or generate new one using Eleven Labs.
 
-        # Generate new audio with rate limiting
+    Concurrent requests for audio that is already being generated wait for that generation
+    instead of queueing on the file lock behind it. The lookup and synthesis run in their own
+    task and hand audio over through a queue, so a slow client holds neither the file lock nor
+    an API_ADMISSION slot while it downloads.
+    """
+    generation = audio_generations.get(audio_path)
+    if generation is not None:
         try:
-            logger.info(f"Generating audio for text: '{chunk_text[:50]}...' using Eleven Labs API")
-            logger.info(f"Using voice_id={VOICE_ID}, model_id={MODEL_ID}")
+            audio_bytes = await asyncio.shield(generation)
+        except Exception:
+            pass  # The other request failed; try again ourselves below
+        else:
+            yield audio_bytes
+            return
 
-            # Check if API key is available
-            if not API_KEY:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Text-to-speech service not configured. Missing API key.",
-                )
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    producer = asyncio.create_task(_load_or_generate_audio(chunk_text, audio_path, queue))
+    try:
+        while (audio_chunk := await queue.get()) is not None:
+            yield audio_chunk
 
-            # Add exponential backoff retry logic for API calls
-            max_retries = 3
-            retry_delay = 1  # starting delay in seconds
+        # Raise the producer's error, if any, once everything it queued has been sent
+        await producer
+    finally:
+        if not producer.done():
+            # The client went away mid-stream; stop generating on its behalf
+            producer.cancel()
+        elif not producer.cancelled():
+            producer.exception()  # Mark retrieved; the producer has already logged it
 
-            for attempt in range(max_retries):
-                try:
-                    async with API_SEMAPHORE:
-                        # Use the text_to_speech.convert method from the client
-                        audio_data = client.text_to_speech.convert(
-                            text=chunk_text,
-                            voice_id=VOICE_ID,
-                            model_id=MODEL_ID,
-                            output_format="mp3_44100_128",
-                        )
 
-                        # Handle if audio_data is a generator
-                        if hasattr(audio_data, "__iter__") and not isinstance(audio_data, bytes | bytearray):
-                            logger.info("Converting generator to bytes")
-                            audio_bytes = b"".join(chunk for chunk in audio_data)
-                        else:
-                            audio_bytes = audio_data
+async def _load_or_generate_audio(chunk_text: str, audio_path: str, queue: asyncio.Queue[bytes | None]) -> None:
+    """Put a chunk's stored or newly synthesized audio on queue, followed by None."""
+    try:
+        async with file_lock(audio_path):
+            try:
+                # Try to read from storage first
+                audio_bytes = await read_chunk_audio(chunk_text, audio_path)
+                if audio_bytes:
+                    queue.put_nowait(audio_bytes)
+                    return
+            except StorageError:
+                # File doesn't exist or is empty, continue to generation
+                pass
+
+            # Let concurrent requests for this audio wait on our result
+            generation = asyncio.get_running_loop().create_future()
+            audio_generations[audio_path] = generation
+
+            # Generate new audio with rate limiting
+            try:
+                logger.info("Generating audio for text: '%.50s...' using Eleven Labs API", chunk_text)
+                logger.info("Using voice_id=%s, model_id=%s", VOICE_ID, MODEL_ID)
+
+                # Check if API key is available
+                if not API_KEY:
+                    raise HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail="Text-to-speech service not configured. Missing API key.",
+                    )
+
+                # Add exponential backoff retry logic for API calls
+                max_retries = 3
+                retry_delay = 1  # starting delay in seconds
+
+                for attempt in range(max_retries):
+                    audio_buffer = bytearray()
+                    try:
+                        async with API_ADMISSION:
+                            # Queue audio for the client as ElevenLabs produces it; the queue is
+                            # unbounded, so the slot is released as soon as synthesis finishes
+                            async for audio_chunk in stream_text_to_speech(chunk_text):
+                                audio_buffer.extend(audio_chunk)
+                                queue.put_nowait(audio_chunk)
 
                         # Check if we got data back
-                        if not audio_bytes or len(audio_bytes) == 0:
+                        if not audio_buffer:
                             raise ValueError("Received empty audio data from Eleven Labs API")
 
                         # Success, break the retry loop
                         break
 
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        # Log the error and retry
-                        logger.warning(
-                            f"API call attempt {attempt + 1} failed: {str(e)}. Retrying in {retry_delay}s..."
-                        )
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        # Last attempt failed, re-raise
-                        raise
-            else:
-                # If we get here, all retries failed
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=f"Text-to-speech service unavailable after {max_retries} attempts",
-                )
-
-            logger.info(f"Successfully generated {len(audio_bytes)} bytes of audio data")
+                    except Exception as e:
+                        # Once audio has been queued for the client the request can no longer be retried
+                        if attempt < max_retries - 1 and not audio_buffer:
+                            # Log the error and retry
+                            logger.warning(
+                                f"API call attempt {attempt + 1} failed: {str(e)}. Retrying in {retry_delay}s..."
+                            )
+                            await asyncio.sleep(retry_delay)
+                            retry_delay *= 2  # Exponential backoff
+                        else:
+                            # Last attempt failed, re-raise
+                            raise
+                else:
+                    # If we get here, all retries failed
+                    raise HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail=f"Text-to-speech service unavailable after {max_retries} attempts",
+                    )
 
-            # Store the generated audio
-            try:
-                storage_path = get_storage_path(audio_path)
-                await storage.write_file(storage_path, audio_bytes)
-                logger.info(f"Saved audio file to {storage_path}")
-            except StorageError as file_error:
-                logger.error(f"Error saving audio file: {str(file_error)}")
-                # Continue even if saving fails - we still have the audio data
+                audio_bytes = bytes(audio_buffer)
+                logger.info("Successfully generated %d bytes of audio data", len(audio_bytes))
 
-            yield audio_bytes
-        except HTTPException:
-            # Pass through HTTP exceptions
-            raise
-        except Exception as e:
-            logger.error(f"Error generating audio: {str(e)}")
-            import traceback
+                # Hand the audio to waiting requests, then persist it; get_or_generate_audio waits
+                # for this task, so the response is not complete until then and serverless
+                # instances are not frozen or recycled with the write still pending
+                generation.set_result(audio_bytes)
+                await persist_audio(audio_path, audio_bytes)
 
-            logger.error(traceback.format_exc())
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate audio: {str(e)}"
-            ) from e
+            except HTTPException:
+                # Pass through HTTP exceptions
+                raise
+            except Exception as e:
+                logger.exception("Error generating audio: %s", e)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate audio: {str(e)}"
+                ) from e
+            finally:
+                audio_generations.pop(audio_path, None)
+                if not generation.done():
+                    generation.set_exception(RuntimeError(f"Audio generation failed for {audio_path}"))
+                    generation.exception()  # Mark retrieved; waiters get it, nobody else needs to
+    finally:
+        queue.put_nowait(None)
 
 
 async def generate_or_get_full_audio(page_path: str, page_slug: str) -> tuple[str, int]:
@@ -444,58 +818,43 @@ async def generate_or_get_full_audio(page_path: str, page_slug: str) -> tuple[st
         full_audio_path = get_full_audio_path(audio_dir, page_slug)
 
         async with file_lock(full_audio_path):
-            try:
-                # Check if full audio already exists
-                storage_path = get_storage_path(full_audio_path)
-                audio_data = await storage.read_file(storage_path)
-                return full_audio_path, len(audio_data)
-            except StorageError:
-                # File doesn't exist or is empty, continue to generation
-                pass
+            # Check if full audio already exists, without downloading it
+            storage_path = get_storage_path(full_audio_path)
+            size = await storage.head(storage_path)
+            if size:
+                return full_audio_path, size
+
+            # File doesn't exist or is empty, continue to generation
 
             # Get all chunks and generate audio for each one if needed
             chunks = await split_content_into_chunks(content="", page_path=page_path)
 
-            # Check if all chunks have audio files and generate missing ones concurrently
-            audio_paths = []
-            generation_tasks = []
-
-            for chunk in chunks:
-                chunk_audio_path = get_audio_path(audio_dir, chunk.get("checksum", ""))
-                try:
-                    storage_path = get_storage_path(chunk_audio_path)
-                    await storage.read_file(storage_path)
-                except StorageError:
-                    # Schedule generation of missing audio
-                    generation_tasks.append(generate_chunk_audio(chunk["text"], chunk_audio_path))
-
-                audio_paths.append(chunk_audio_path)
-
-            # Wait for all audio generation tasks to complete if any
-            if generation_tasks:
-                await asyncio.gather(*generation_tasks)
+            # Read every chunk's audio concurrently; missing ones come back as StorageError
+            audio_paths = [get_audio_path(audio_dir, chunk.checksum) for chunk in chunks]
+            results = await asyncio.gather(
+                *(read_chunk_audio(chunk.text, path) for chunk, path in zip(chunks, audio_paths, strict=True)),
+                return_exceptions=True,
+            )
 
-            # Ensure all audio files exist
-            for audio_path in audio_paths:
-                try:
-                    storage_path = get_storage_path(audio_path)
-                    await storage.read_file(storage_path)
-                except StorageError as e:
-                    logger.error(f"Error reading audio file: {str(e)}")
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Failed to generate all required audio chunks",
-                    ) from e
+            missing = []
+            for i, result in enumerate(results):
+                if isinstance(result, StorageError):
+                    missing.append(i)
+                elif isinstance(result, BaseException):
+                    raise result
+
+            # Generate the missing chunks; each returns the audio it stored
+            if missing:
+                generated = await generate_chunks_batch(
+                    [chunks[i].text for i in missing], [audio_paths[i] for i in missing], known_missing=True
+                )
+                for i, chunk_audio in zip(missing, generated, strict=True):
+                    results[i] = chunk_audio
 
-            # Concatenate audio files
-            all_audio = b""
-            for audio_path in audio_paths:
-                storage_path = get_storage_path(audio_path)
-                chunk_audio = await storage.read_file(storage_path)
-                all_audio += chunk_audio
+            # Concatenate audio files in one pass rather than copying on every +=
+            all_audio = b"".join(results)
 
             # Save the concatenated file
-            storage_path = get_storage_path(full_audio_path)
             await storage.write_file(storage_path, all_audio)
 
             return full_audio_path, len(all_audio)
@@ -503,21 +862,22 @@ async def generate_or_get_full_audio(page_path: str, page_slug: str) -> tuple[st
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating full audio: {str(e)}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.exception("Error generating full audio: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate full audio: {str(e)}"
         ) from e
 
 
-async def generate_chunk_audio(text: str, audio_path: str) -> None:
+async def generate_chunk_audio(text: str, audio_path: str, known_missing: bool = False) -> bytes:
     """Generate audio for a chunk of text.
 
     Args:
         text: The text to generate audio for
         audio_path: The path to save the audio file to
+        known_missing: Skip the storage lookup because the caller has just found no audio
+
+    Returns:
+        bytes: The chunk's audio, whether it was already stored or just generated
 
     Raises:
         HTTPException: If there is an error generating the audio
@@ -525,51 +885,64 @@ async def generate_chunk_audio(text: str, audio_path: str) -> None:
     """
     try:
         async with file_lock(audio_path):
-            try:
-                # Check if audio already exists in storage
-                storage_path = get_storage_path(audio_path)
-                await storage.read_file(storage_path)
-                return
-            except StorageError:
-                # File doesn't exist or is empty, continue to generation
-                pass
+            if not known_missing:
+                try:
+                    # Check if audio already exists in storage
+                    return await read_chunk_audio(text, audio_path)
+                except StorageError:
+                    # File doesn't exist or is empty, continue to generation
+                    pass
 
             # Generate audio using ElevenLabs client
-            audio_data = client.text_to_speech.convert(
-                text=text,
-                voice_id=VOICE_ID,
-                model_id=MODEL_ID,
-                output_format="mp3_44100_128",
-            )
-
-            # Handle if audio_data is a generator
-            if hasattr(audio_data, "__iter__") and not isinstance(audio_data, bytes | bytearray):
-                logger.info("Converting generator to bytes")
-                audio_bytes = b"".join(chunk for chunk in audio_data)
-            else:
-                audio_bytes = audio_data
+            async with API_ADMISSION:
+                audio_bytes = await text_to_speech(text)
 
             # Check if we got data back
-            if not audio_bytes or len(audio_bytes) == 0:
+            if not audio_bytes:
                 raise ValueError("Received empty audio data from Eleven Labs API")
 
-            # Save to storage
-            storage_path = get_storage_path(audio_path)
-            await storage.write_file(storage_path, audio_bytes)
+            # Save to storage before releasing the lock, as get_or_generate_audio does
+            await persist_audio(audio_path, audio_bytes)
+
+            return audio_bytes
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating chunk audio: {str(e)}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.exception("Error generating chunk audio: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate chunk audio: {str(e)}",
         ) from e
 
 
+async def generate_chunks_batch(texts: list[str], audio_paths: list[str], known_missing: bool = False) -> list[bytes]:
+    """Generate audio for several chunks, returning each chunk's audio in order.
+
+    ElevenLabs has no multi-text text-to-speech endpoint, so the chunks are generated
+    concurrently instead; API_ADMISSION inside generate_chunk_audio bounds how many
+    requests are in flight at once. known_missing is passed on to generate_chunk_audio.
+
+    Raises:
+        HTTPException: If any chunk fails to generate
+
+    """
+    return await asyncio.gather(
+        *(
+            generate_chunk_audio(text, audio_path, known_missing)
+            for text, audio_path in zip(texts, audio_paths, strict=True)
+        )
+    )
+
+
+def _concatenate_files(paths: list[str], output_path: str) -> None:
+    # Copy in 1 MiB blocks so memory stays flat however large the inputs are
+    with open(output_path, "wb") as outfile:
+        for path in paths:
+            with open(path, "rb") as infile:
+                shutil.copyfileobj(infile, outfile, 1 << 20)
+
+
 async def concatenate_mp3_files(audio_paths: list[str], output_path: str) -> None:
     """Concatenate MP3 files properly, handling headers and footers.
 
@@ -577,10 +950,7 @@ async def concatenate_mp3_files(audio_paths: list[str], output_path: str) -> Non
     For a more robust solution in the future, consider using pydub or another audio library.
     """
     try:
-        with open(output_path, "wb") as outfile:
-            for audio_path in audio_paths:
-                with open(audio_path, "rb") as infile:
-                    outfile.write(infile.read())
+        await asyncio.to_thread(_concatenate_files, audio_paths, output_path)
     except Exception as e:
         logger.error(f"Error concatenating MP3 files: {str(e)}")
         # Clean up the partial file
@@ -590,12 +960,23 @@ async def concatenate_mp3_files(audio_paths: list[str], output_path: str) -> Non
         raise
 
 
+def _find_page(full_path: str, slug: str) -> Page | None:
+    """Return the page at full_path, or None if there is no such file.
+
+    _page stats the file to validate its mtime cache, so that one stat doubles as the existence check.
+    """
+    try:
+        return _page(full_path, slug)
+    except FileNotFoundError:
+        return None
+
+
 async def get_content_page(path_or_slug: str, nested_slug: str | None = None) -> Page:
     """Get content page from path or slug."""
     try:
         # If nested_slug contains slashes, it's likely a mistake in path handling
         if nested_slug and "/" in nested_slug:
-            logger.warning(f"Potential path handling issue - nested_slug contains slashes: {nested_slug}")
+            logger.warning("Potential path handling issue - nested_slug contains slashes: %s", nested_slug)
             # Handle this case by splitting nested_slug and using only the last part
             nested_slug = nested_slug.split("/")[-1]
 
@@ -608,11 +989,12 @@ async def get_content_page(path_or_slug: str, nested_slug: str | None = None) ->
                 top_level = parts[0]
                 middle = parts[-1]
                 file_path = f"{top_level}/{middle}/{middle}.md"
-                logger.info(f"Looking for file at path: {file_path}")
+                logger.info("Looking for file at path: %s", file_path)
                 full_path = safe_path(file_path)
 
-                if cached_file_exists(full_path):
-                    return _page(full_path, middle)
+                page = _find_page(full_path, middle)
+                if page is not None:
+                    return page
 
             # For paths like "strategy/tiny-changes"
             if len(parts) == 2:
@@ -620,11 +1002,12 @@ async def get_content_page(path_or_slug: str, nested_slug: str | None = None) ->
                 top_level = parts[0]
                 page_name = parts[1]
                 file_path = f"{top_level}/{page_name}/{page_name}.md"
-                logger.info(f"Looking for file at path: {file_path}")
+                logger.info("Looking for file at path: %s", file_path)
                 full_path = safe_path(file_path)
 
-                if cached_file_exists(full_path):
-                    return _page(full_path, page_name)
+                page = _find_page(full_path, page_name)
+                if page is not None:
+                    return page
 
             # If we couldn't resolve a special case, throw 404
             raise HTTPException(
@@ -634,30 +1017,32 @@ async def get_content_page(path_or_slug: str, nested_slug: str | None = None) ->
         if nested_slug:
             # Handle nested page
             file_path = f"{path_or_slug}/{nested_slug}/{nested_slug}.md"
-            logger.info(f"Looking for nested file at path: {file_path}")
+            logger.info("Looking for nested file at path: %s", file_path)
             full_path = safe_path(file_path)
 
-            if not cached_file_exists(full_path):
+            page = _find_page(full_path, nested_slug)
+            if page is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail=f"Content file not found: {file_path}"
                 )
 
-            return _page(full_path, nested_slug)
+            return page
         else:
             # Handle simple slug
             if not is_valid_slug(path_or_slug):
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid slug")
 
             file_path = f"{path_or_slug}/{path_or_slug}.md"
-            logger.info(f"Looking for simple file at path: {file_path}")
+            logger.info("Looking for simple file at path: %s", file_path)
             full_path = safe_path(file_path)
 
-            if not cached_file_exists(full_path):
+            page = _find_page(full_path, path_or_slug)
+            if page is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail=f"Content file not found: {file_path}"
                 )
 
-            return _page(full_path, path_or_slug)
+            return page
     except HTTPException:
         raise
     except Exception as e:
@@ -668,17 +1053,20 @@ async def get_content_page(path_or_slug: str, nested_slug: str | None = None) ->
 
 
 @app.get("/api/audio/")
-async def audio_health_check() -> JSONResponse:
+async def audio_health_check() -> Response:
     """Return API health status and configuration information."""
     try:
-        return JSONResponse(
-            {
-                "status": "OK" if API_KEY else "WARNING",
-                "api_key_valid": bool(API_KEY),
-                "voice_id": VOICE_ID or "default",
-                "model_id": MODEL_ID or "default",
-                "message": "Audio API is running",
-            }
+        return Response(
+            orjson.dumps(
+                {
+                    "status": "OK" if API_KEY else "WARNING",
+                    "api_key_valid": bool(API_KEY),
+                    "voice_id": VOICE_ID or "default",
+                    "model_id": MODEL_ID or "default",
+                    "message": "Audio API is running",
+                }
+            ),
+            media_type="application/json",
         )
     except Exception as e:
         logger.error(f"Failed to check audio API health: {str(e)}")
@@ -688,7 +1076,7 @@ async def audio_health_check() -> JSONResponse:
 
 
 @app.get("/api/audio/{slug}/metadata", response_model=AudioMetadataResponse)
-async def get_audio_metadata(slug: str) -> JSONResponse:
+async def get_audio_metadata(slug: str) -> Response:
     """Return metadata about available audio chunks for a page."""
     page = await get_content_page(slug)
 
@@ -702,19 +1090,23 @@ async def get_audio_metadata(slug: str) -> JSONResponse:
         )
 
         # Check which chunks have audio files
-        audio_dir = get_audio_dir(page.path)
+        present = await asyncio.to_thread(list_local_audio, get_audio_dir(page.path))
         for chunk in chunks:
-            audio_path = get_audio_path(audio_dir, chunk["checksum"])
-            chunk["has_audio"] = os.path.exists(audio_path)
-
-        return JSONResponse(
-            {
-                "page": {
-                    "slug": page.slug,
-                    "title": page.title,
-                },
-                "chunks": chunks,
-            }
+            chunk.has_audio = has_local_audio(chunk, present)
+            chunk.url = f"/api/audio/{page.slug}/{chunk.id}?checksum={chunk.checksum}"
+
+        # orjson keeps encoding cheap for long pages, whose chunks carry kilobytes of text each
+        return Response(
+            orjson.dumps(
+                {
+                    "page": {
+                        "slug": page.slug,
+                        "title": page.title,
+                    },
+                    "chunks": [chunk.json() for chunk in chunks],
+                }
+            ),
+            media_type="application/json",
         )
     except HTTPException:
         raise
@@ -726,8 +1118,13 @@ async def get_audio_metadata(slug: str) -> JSONResponse:
 
 
 @app.get("/api/audio/{slug}/{chunk_id}")
-async def get_chunk_audio(slug: str, chunk_id: str) -> StreamingResponse:
-    """Return audio for a specific chunk of content."""
+async def get_chunk_audio(slug: str, chunk_id: str, checksum: str | None = None) -> Response:
+    """Return audio for a specific chunk of content.
+
+    When the client passes the chunk's checksum from the metadata response, it still matches
+    the page's current chunk and that audio is already stored, the audio is read directly,
+    without the legacy-name fallback or the generation lock.
+    """
     try:
         # Try to see if this is actually a folder/page request without a chunk ID
         file_path = f"{slug}/{chunk_id}/{chunk_id}.md"
@@ -741,7 +1138,8 @@ async def get_chunk_audio(slug: str, chunk_id: str) -> StreamingResponse:
         # Get the page content
         page = await get_content_page(slug)
 
-        # Get content and split into chunks using page path directly
+        # Get content and split into chunks using page path directly; the split is memoized on
+        # the file's mtime, so this is a cache hit unless the page changed
         chunks = await split_content_into_chunks(
             content="",  # Not needed when using page_path
             title=page.title,
@@ -750,26 +1148,30 @@ async def get_chunk_audio(slug: str, chunk_id: str) -> StreamingResponse:
         )
 
         # Find the requested chunk
-        chunk = next((c for c in chunks if c["id"] == chunk_id), None)
+        chunk = next((c for c in chunks if c.id == chunk_id), None)
         if not chunk:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Chunk {chunk_id} not found")
 
         # Generate audio path
         audio_dir = get_audio_dir(page.path)
-        audio_path = get_audio_path(audio_dir, chunk["checksum"])
+        audio_path = get_audio_path(audio_dir, chunk.checksum)
+
+        # Fast path: the client's checksum is current, so the audio file is known. A checksum from
+        # before a content edit no longer matches and gets the current chunk's audio below.
+        if checksum == chunk.checksum:
+            audio_bytes = await read_stored_audio(audio_path)
+            if audio_bytes:
+                return Response(audio_bytes, media_type="audio/mpeg")
 
         # Get or generate audio
-        audio_data = get_or_generate_audio(chunk["text"], audio_path)
+        audio_data = get_or_generate_audio(chunk.text, audio_path)
 
         return StreamingResponse(audio_data, media_type="audio/mpeg")
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_chunk_audio: {str(e)}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.exception("Error in get_chunk_audio: %s", e)
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get audio: {str(e)}"
@@ -779,33 +1181,20 @@ async def get_chunk_audio(slug: str, chunk_id: str) -> StreamingResponse:
 @app.get("/api/audio/{path:path}", response_model=None)
 async def get_page_audio(
     path: str, generate_all: bool = False, format: str = "json", background_tasks: BackgroundTasks = None
-) -> JSONResponse | StreamingResponse:
+) -> Response:
     """Retrieve page audio for both nested and non-nested pages."""
     # Extract the components from the path
     path_parts = path.split("/")
 
-    # Special case for the triple segment pattern "strategy/tiny-changes/tiny-changes"
-    if len(path_parts) >= 3 and path_parts[-1] == path_parts[-2]:
-        # Direct route to handle the common pattern
-        directory = path_parts[0]
-        page = path_parts[-1]
-        logger.info(f"Special case handling for repeated segments: {directory}/{page}")
-        return await get_page_audio_impl(directory, page, generate_all, format, background_tasks)
-
-    # Handle different path structures
-    if len(path_parts) == 1:
-        # Single segment (slug only)
-        return await get_page_audio_impl(path_parts[0], None, generate_all, format, background_tasks)
-    elif len(path_parts) == 2:
-        # Two segments (directory/slug)
-        return await get_page_audio_impl(path_parts[0], path_parts[1], generate_all, format, background_tasks)
-    elif len(path_parts) >= 3:
-        # For other multi-level paths, use only first and last segments
-        # This avoids passing complex nested paths that confuse the file resolution
-        directory = path_parts[0]
-        page = path_parts[-1]
-        logger.info(f"Multi-level path handling: using {directory}/{page}")
-        return await get_page_audio_impl(directory, page, generate_all, format, background_tasks)
+    # A single segment is a slug and two are directory/slug. Deeper paths, including the
+    # repeated "strategy/tiny-changes/tiny-changes" form, use only the first and last
+    # segments, since the full nested path confuses the file resolution.
+    directory = path_parts[0]
+    page = None if len(path_parts) == 1 else path_parts[-1]
+    if len(path_parts) >= 3:
+        logger.info("Multi-level path handling: using %s/%s", directory, page)
+
+    return await get_page_audio_impl(directory, page, generate_all, format, background_tasks)
 
 
 async def get_page_audio_impl(
@@ -814,7 +1203,7 @@ async def get_page_audio_impl(
     generate_all: bool = False,
     format: str = "json",
     background_tasks: BackgroundTasks = None,
-) -> JSONResponse | StreamingResponse:
+) -> Response:
     """Retrieve page audio for both nested and non-nested pages.
 
     Args:
@@ -825,7 +1214,7 @@ async def get_page_audio_impl(
         background_tasks: FastAPI background tasks for async processing
 
     Returns:
-        JSONResponse or StreamingResponse
+        JSON metadata, or a RedirectResponse to the full audio file when format is 'mp3'
 
     Raises:
         HTTPException: If there is an error getting the page audio
@@ -838,17 +1227,13 @@ async def get_page_audio_impl(
         # If MP3 format requested, return full audio file
         if format.lower() == "mp3":
             # Generate or get full audio file
-            audio_path, audio_size = await generate_or_get_full_audio(page.path, page.slug)
-
-            # Return streaming response with audio file
-            audio_data = await storage.read_file(audio_path)
-            return StreamingResponse(
-                iter([audio_data]),
-                media_type="audio/mpeg",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{page.slug}.mp3"',
-                    "Content-Length": str(audio_size),
-                },
+            audio_path, _ = await generate_or_get_full_audio(page.path, page.slug)
+
+            # Send the client to the public blob URL so the file never passes through this process;
+            # download=1 keeps it a download, as the Content-Disposition attachment was before
+            return RedirectResponse(
+                storage.public_url(get_storage_path(audio_path), download=True),
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
             )
 
         # Otherwise, return metadata JSON
@@ -863,44 +1248,42 @@ async def get_page_audio_impl(
         audio_dir = get_audio_dir(page.path)
 
         if generate_all:
-            # Generate audio for all chunks
-            generation_tasks = []
-            for chunk in chunks:
-                audio_path = get_audio_path(audio_dir, chunk["checksum"])
-                # If we have background tasks, use them
-                if background_tasks:
-                    background_tasks.add_task(generate_chunk_audio, chunk["text"], audio_path)
-                    chunk["has_audio"] = "pending"  # Mark as pending generation
-                else:
-                    # Schedule generation (will complete before response)
-                    generation_tasks.append(generate_chunk_audio(chunk["text"], audio_path))
-                    chunk["has_audio"] = True
-
-            # If we're not using background tasks, wait for all to complete
-            if generation_tasks and not background_tasks:
-                await asyncio.gather(*generation_tasks)
+            # Generate audio for all chunks in one concurrent batch; Starlette runs background
+            # tasks one after another, so a task per chunk would synthesize them serially
+            generation_texts = [chunk.text for chunk in chunks]
+            generation_paths = [get_audio_path(audio_dir, chunk.checksum) for chunk in chunks]
+
+            if background_tasks:
+                background_tasks.add_task(generate_chunks_batch, generation_texts, generation_paths)
+                for chunk in chunks:
+                    chunk.has_audio = "pending"  # Mark as pending generation
+            else:
+                # Wait for all to complete before responding
+                await generate_chunks_batch(generation_texts, generation_paths)
+                for chunk in chunks:
+                    chunk.has_audio = True
         else:
             # Just check which chunks have audio
+            present = await asyncio.to_thread(list_local_audio, audio_dir)
             for chunk in chunks:
-                audio_path = get_audio_path(audio_dir, chunk["checksum"])
-                chunk["has_audio"] = os.path.exists(audio_path) and os.path.getsize(audio_path) > 0
-
-        return JSONResponse(
-            {
-                "page": {
-                    "slug": page.slug,
-                    "title": page.title,
-                },
-                "chunks": chunks,
-            }
+                chunk.has_audio = has_local_audio(chunk, present)
+
+        return Response(
+            orjson.dumps(
+                {
+                    "page": {
+                        "slug": page.slug,
+                        "title": page.title,
+                    },
+                    "chunks": [chunk.json() for chunk in chunks],
+                }
+            ),
+            media_type="application/json",
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_page_audio: {str(e)}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.exception("Error in get_page_audio: %s", e)
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get audio metadata: {str(e)}"
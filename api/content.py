@@ -1,7 +1,8 @@
 from functools import lru_cache
 
+import orjson
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from api._content import _pages
 from api._filesystem import get_content_dir
@@ -14,7 +15,7 @@ app = FastAPI()
 def _get_content(
     path: str | None = None,
     type: str | None = None,
-) -> JSONResponse:
+) -> Response:
     if path:
         if not is_valid_path(path):
             raise HTTPException(status_code=400, detail="Invalid path")
@@ -32,14 +33,15 @@ def _get_content(
         types = type.split(",")
         ps = [p for p in ps if p.type in types]
 
-    return JSONResponse({"pages": [p.json() for p in ps]})
+    # orjson serializes the page listing several times faster than the stdlib encoder
+    return Response(orjson.dumps({"pages": [p.json() for p in ps]}), media_type="application/json")
 
 
 @app.get("/api/content")
 def get_content(
     path: str | None = None,
     type: str | None = None,
-) -> JSONResponse:
+) -> Response:
     """Get content from the content directory."""
     return _get_content(path, type)
 
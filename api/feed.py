@@ -8,7 +8,7 @@ from fastapi import FastAPI, HTTPException, Response
 
 from api._config import get_feeds_config, get_site_config
 from api._content import _pages
-from api._validation import get_content_dir
+from api._filesystem import get_content_dir
 from api.audio import generate_or_get_full_audio, get_audio_dir, get_audio_path, split_content_into_chunks
 
 app = FastAPI()
@@ -1,11 +1,11 @@
-import asyncio
 import io
 import re
-from functools import lru_cache
+import threading
+import weakref
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse
 from PIL import Image
 
 # Configuration
@@ -14,11 +14,33 @@ CACHE_TIME = 86400 * 30  # 30 days
 ALLOWED_FORMATS = {"webp", "avif", "jpeg"}
 VALID_SLUG = re.compile(r"^[a-z0-9-]{1,64}$")
 
+# Vercel-specific optimizations
+CACHE_HEADERS = {
+    "Cache-Control": f"public, max-age={CACHE_TIME}, immutable",
+    "CDN-Cache-Control": f"max-age={CACHE_TIME}",
+    "Vercel-CDN-Cache-Control": f"max-age={CACHE_TIME}",
+}
+
 app = FastAPI()
 
+# Per-slug locks serialising image generation; an entry goes away once no request holds its lock
+_image_locks: weakref.WeakValueDictionary[str, threading.Lock] = weakref.WeakValueDictionary()
+_image_locks_guard = threading.Lock()
+
+
+def _image_lock(slug: str) -> threading.Lock:
+    """Return the lock guarding generation of a slug's image variants."""
+    with _image_locks_guard:
+        lock = _image_locks.get(slug)
+
+        if lock is None:
+            lock = threading.Lock()
+            _image_locks[slug] = lock
+
+        return lock
 
-@lru_cache(maxsize=1024)
-def _get_image(slug: str, w: int = 0, q: int = 85, f: str = "webp") -> StreamingResponse:
+
+def _get_image(slug: str, w: int = 0, q: int = 85, f: str = "webp") -> FileResponse:
     """Get an optimized image from the cache or generate a new one."""
     # Security validation
     if not VALID_SLUG.match(slug):
@@ -28,6 +50,12 @@ def _get_image(slug: str, w: int = 0, q: int = 85, f: str = "webp") -> Streaming
     if f not in ALLOWED_FORMATS:
         f = "webp"
 
+    optimized_path = IMAGE_DIR / f"{slug}_{w}w_{q}q.{f}"
+
+    # Already generated: serve it without touching the original or taking the lock
+    if optimized_path.exists():
+        return FileResponse(optimized_path, headers=CACHE_HEADERS, media_type=f"image/{f}")
+
     # Find original image
     original_path = next(IMAGE_DIR.glob(f"{slug}.*"), None)
 
@@ -35,11 +63,10 @@ def _get_image(slug: str, w: int = 0, q: int = 85, f: str = "webp") -> Streaming
         raise HTTPException(status_code=404, detail="Image not found")
 
     # Optimization pipeline
-    lock = app.ctx.locks.setdefault(slug, asyncio.Lock())
+    lock = _image_lock(slug)
 
     with lock:
-        optimized_path = IMAGE_DIR / f"{slug}_{w}w_{q}q.{f}"
-
+        # Another request may have generated it while we waited for the lock
         if not optimized_path.exists():
             with Image.open(original_path) as img:
                 if w and 0 < w < img.width:
@@ -52,18 +79,11 @@ def _get_image(slug: str, w: int = 0, q: int = 85, f: str = "webp") -> Streaming
                 buffer.seek(0)
                 optimized_path.write_bytes(buffer.getvalue())
 
-    # Vercel-specific optimizations
-    headers = {
-        "Cache-Control": f"public, max-age={CACHE_TIME}, immutable",
-        "CDN-Cache-Control": f"max-age={CACHE_TIME}",
-        "Vercel-CDN-Cache-Control": f"max-age={CACHE_TIME}",
-    }
-
-    return StreamingResponse(optimized_path.open("rb"), headers=headers, media_type=f"image/{f}")
+    return FileResponse(optimized_path, headers=CACHE_HEADERS, media_type=f"image/{f}")
 
 
 @app.get("/api/images")
-def get_image(slug: str, w: int = 0, q: int = 85, f: str = "webp") -> StreamingResponse:
+def get_image(slug: str, w: int = 0, q: int = 85, f: str = "webp") -> FileResponse:
     """Get an optimized image from the cache or generate a new one."""
     return _get_image(slug, w, q, f)
 
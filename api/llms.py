@@ -1,3 +1,4 @@
+import io
 from functools import lru_cache
 
 from fastapi import FastAPI
@@ -17,20 +18,20 @@ def _get_llms() -> str:
     site_config = get_site_config()
     site_url = site_config.get("url").rstrip("/")
 
-    entries = []
+    entries = io.StringIO()
 
-    entries.append(f"# {site_config.get('title')}\n\n> {site_config.get('description')}\n")
+    entries.write(f"# {site_config.get('title')}\n\n> {site_config.get('description')}\n")
 
     for page in all_pages:
         try:
             _url = page.url()
             _description = f": {page.description}" if page.description else ""
 
-            entries.append(f"- [{page.title}]({site_url}{_url}){_description}")
+            entries.write(f"\n- [{page.title}]({site_url}{_url}){_description}")
         except Exception as e:
             print(f"Error processing {page.path}: {e}")
 
-    return "\n".join(entries)
+    return entries.getvalue()
 
 
 @app.get("/api/llms")
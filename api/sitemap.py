@@ -1,14 +1,25 @@
 import datetime
+import io
 from functools import lru_cache
 
 from fastapi import FastAPI, Response
 
 from api._config import get_site_config
 from api._content import _pages
-from api._validation import get_content_dir
+from api._filesystem import get_content_dir
 
 app = FastAPI()
 
+# Sitemap <url> entry, formatted once per page with (loc, lastmod, changefreq, priority)
+_URL_TEMPLATE = """
+    <url>
+        <loc>%s</loc>
+        <lastmod>%s</lastmod>
+        <changefreq>%s</changefreq>
+        <priority>%s</priority>
+    </url>
+    """
+
 
 @lru_cache(maxsize=1024)
 def _sitemap() -> Response:
@@ -19,19 +30,16 @@ def _sitemap() -> Response:
     # Get all content pages
     all_pages = _pages(get_content_dir())
 
-    # Generate sitemap XML
-    sitemap_items = []
+    # Write sitemap XML straight into a single buffer
+    xml = io.StringIO()
     today = datetime.datetime.now().strftime("%Y-%m-%d")
 
+    xml.write("""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+""")
+
     # Add homepage
-    sitemap_items.append(f"""
-    <url>
-        <loc>{base_url}</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>daily</changefreq>
-        <priority>1.0</priority>
-    </url>
-    """)
+    xml.write(_URL_TEMPLATE % (base_url, today, "daily", "1.0"))
 
     # Add content pages
     for page in all_pages:
@@ -39,24 +47,14 @@ def _sitemap() -> Response:
         lastmod_dt = page.updated or page.created
         lastmod = lastmod_dt.strftime("%Y-%m-%d") if lastmod_dt else today
 
-        sitemap_items.append(f"""
-    <url>
-        <loc>{base_url}/{url_path}</loc>
-        <lastmod>{lastmod}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>0.8</priority>
-    </url>
-    """)
+        xml.write(_URL_TEMPLATE % (f"{base_url}/{url_path}", lastmod, "weekly", "0.8"))
 
-    # Create XML content
-    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{"".join(sitemap_items)}
+    xml.write("""
 </urlset>
-"""
+""")
 
     # Ensure correct media type for sitemap
-    return Response(xml, media_type="application/xml")
+    return Response(xml.getvalue(), media_type="application/xml")
 
 
 @app.get("/api/sitemap")